@@ -0,0 +1,139 @@
+"""Approximate sales analytics backed by per-day mergeable sketches.
+
+Each day of sales keeps exact additive rollups (sale count, revenue, payment
+method counts, revenue per month) plus sketches for the things that are
+expensive to answer exactly over a large history: distinct customers
+(HyperLogLog), payment quantiles (KLL) and top models (Space-Saving). A date
+range is answered by merging the buckets it covers, without touching the raw
+rows.
+"""
+
+from collections import Counter
+
+import streamlit as st
+
+from data import load_shared_rollup
+from sketches import KLL, HyperLogLog, SpaceSaving
+
+# Default the approximate mode on once the history gets this large
+APPROX_DEFAULT_ROWS = 1_000_000
+
+
+class SalesBucket:
+    def __init__(self):
+        self.count = 0
+        self.revenue = 0.0
+        self.payment_methods = Counter()
+        self.customers = HyperLogLog()
+        self.payments = KLL()
+        self.models = SpaceSaving()
+
+    def update(self, sales):
+        self.count += len(sales)
+        self.revenue += float(sales['Payment'].sum())
+        # NULLs are skipped like the exact path does; categoricals report unused categories as 0
+        methods = sales['PaymentMethod'].value_counts()
+        self.payment_methods.update(methods[methods > 0].to_dict())
+        self.customers.update(sales['CustomerId'].dropna().to_numpy())
+        self.payments.update(sales['Payment'].dropna().to_numpy())
+        self.models.update(sales['Model'].to_numpy())
+
+    def merge(self, other):
+        self.count += other.count
+        self.revenue += other.revenue
+        self.payment_methods.update(other.payment_methods)
+        self.customers.merge(other.customers)
+        self.payments.merge(other.payments)
+        self.models.merge(other.models)
+
+
+class SalesSketches:
+    """Per-day ``SalesBucket``s for sold vehicles."""
+
+    def __init__(self):
+        self.buckets = {}
+
+    @classmethod
+    def from_frame(cls, df):
+        sketches = cls()
+        sketches.add_sales(df)
+        return sketches
+
+    def add_sales(self, df):
+        """Fold new rows into their day buckets; non-sold rows are ignored."""
+        sales = df[df['Status'] == 'Sold']
+        for day, day_sales in sales.groupby(sales['PurchaseDate'].dt.date):
+            self.buckets.setdefault(day, SalesBucket()).update(day_sales)
+
+    def summarize(self, start_date=None, end_date=None):
+        days = [day for day in self.buckets
+                if (start_date is None or day >= start_date) and (end_date is None or day <= end_date)]
+        total = SalesBucket()
+        monthly = {}
+        for day in sorted(days):
+            bucket = self.buckets[day]
+            total.merge(bucket)
+            month = monthly.setdefault(day.strftime('%Y-%m'), [0.0, 0])
+            month[0] += bucket.revenue
+            month[1] += bucket.count
+        return SalesSummary(total, monthly)
+
+
+class SalesSummary:
+    """Answers for one date range, each estimate paired with its error bound."""
+
+    def __init__(self, bucket, monthly):
+        self.bucket = bucket
+        self.monthly = monthly
+
+    @property
+    def count(self):
+        return self.bucket.count
+
+    @property
+    def revenue(self):
+        return self.bucket.revenue
+
+    @property
+    def payment_methods(self):
+        return self.bucket.payment_methods
+
+    def unique_customers(self):
+        """``(estimate, +/- bound)`` at roughly 95% confidence (2 standard errors)."""
+        estimate = self.bucket.customers.estimate()
+        return estimate, 2 * self.bucket.customers.relative_error * estimate
+
+    def payment_quantile(self, q):
+        """``(estimate, (low, high))``."""
+        payments = self.bucket.payments
+        return payments.quantile(q), payments.quantile_bounds(q)
+
+    def top_models(self, k=10):
+        return self.bucket.models.top(k)
+
+    def top_model(self):
+        """``(model, guaranteed)`` where ``guaranteed`` means it is certainly the most sold."""
+        top = self.bucket.models.top(1)
+        if not top:
+            return None, True
+        return top[0][0], self.bucket.models.guaranteed(top[0][0])
+
+
+# Built once per dataset version and shared by all sessions and workers
+def load_sales_sketches():
+    return load_shared_rollup('sales_sketches', SalesSketches.from_frame)
+
+
+# Whole-history summary (the Dashboard's), merged once per dataset version instead of every rerun
+def load_sales_summary():
+    return load_shared_rollup('sales_summary_all', lambda df: load_sales_sketches().summarize())
+
+
+def approximate_mode_toggle(df, key):
+    return st.checkbox(
+        "Approximate mode (sketches)",
+        value=len(df) >= APPROX_DEFAULT_ROWS,
+        key=key,
+        help="Answer from per-day HyperLogLog / KLL / Space-Saving sketches instead of scanning "
+             "every row. Untick to fall back to exact results."
+    )
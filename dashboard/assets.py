@@ -0,0 +1,99 @@
+"""Static HTML/CSS for the dashboard.
+
+Built once when the module is first imported instead of on every Streamlit
+rerun of the main script.
+"""
+
+# Enhanced CSS with top navigation
+CSS = """
+<style>
+    /* Main header styling */
+    .main-header {
+        background: linear-gradient(90deg, #1e3c72 0%, #2a5298 100%);
+        color: white;
+        padding: 1.5rem 2rem;
+        border-radius: 0 0 15px 15px;
+        text-align: center;
+        margin-bottom: 2rem;
+        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
+    }
+    
+    .main-header h1 {
+        font-size: 2.5rem;
+        font-weight: bold;
+        margin-bottom: 0.5rem;
+    }
+    
+    /* Top navigation */
+    .top-nav {
+        background: black;
+        padding: 0.4rem 0.4rem;
+        border-radius: 10px;
+        margin-bottom: 0.4rem;
+        box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1);
+    }
+    
+    /* Navigation buttons */
+    .stButton > button {
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        color: white;
+        border: none;
+        border-radius: 8px;
+        padding: 0.6rem 1rem;
+        font-weight: 600;
+        transition: all 0.3s ease;
+        width: 100%;
+        margin: 0.2rem 0;
+    }
+    
+    .stButton > button:hover {
+        transform: translateY(-2px);
+        box-shadow: 0 4px 12px rgba(102, 126, 234, 0.3);
+    }
+    
+    /* Metric cards */
+    .metric-card {
+        background-color: #f8f9fa;
+        padding: 1rem;
+        border-radius: 0.5rem;
+        border-left: 4px solid #1f77b4;
+    }
+    
+    /* Chart containers */
+    .chart-container {
+        background: black;
+        padding: 0.4rem;
+        border-radius: 10px;
+        box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1);
+        margin: 1rem 0;
+    }
+    
+    /* Hide sidebar completely */
+    .css-1d391kg {
+        display: none;
+    }
+    
+    /* Page content styling */
+    .block-container {
+        padding-top: 1rem;
+        padding-bottom: 2rem;
+    }
+</style>
+"""
+
+HEADER_HTML = """
+<div class="main-header">
+    <h1>CM Vehicle Management System</h1>
+</div>
+"""
+
+FOOTER_HTML = """
+<div style="text-align: center; color: #ecf0f1; padding: 2rem; background: linear-gradient(to bottom, #0d0f14, #000000); border-radius: 15px; margin: 2rem 0;">
+    <h3> CM Vehicle Management System</h3>
+    <p><strong>Vehicle Sales & Management Dashboard</strong></p>
+    <p>Built with Group AT | © 2025 CM Vehicle Management. All rights reserved.</p>
+    <p style="font-size: 0.9rem; opacity: 0.8;">
+        📧 Email: chamod@cmvehicles.com | 📞 Phone: +94 70 520 6400 
+    </p>
+</div>
+"""
@@ -0,0 +1,334 @@
+"""Cache shared between dashboard worker processes.
+
+``st.cache_data`` / ``st.cache_resource`` only live inside one Streamlit
+process, so replicas behind a load balancer each reload and re-aggregate the
+same data. ``SharedCache`` puts data frames, rollups and figures in a store
+every worker can see:
+
+- ``DiskCache``: a directory shared by the processes on one host
+- ``RedisCache``: any Redis-protocol server (redis-py client), shared across hosts
+
+Entries are keyed by a content hash of their inputs, expire after a TTL,
+are pickled and zlib-compressed, and a missing entry is computed by only one
+worker at a time (single-flight lock) while the others wait for its result.
+If the backend is unreachable or an entry can't be read back, values are
+computed locally with a warning instead of failing the page.
+
+Values are unpickled, so the cache directory / Redis instance must only be
+writable by the dashboard itself.
+
+Configure with ``DASHBOARD_CACHE``: ``redis://host:6379/0``, ``disk:/some/dir``,
+or ``off``. The default is a per-user directory under the system temp dir. A
+cache directory must be owned by the current user with mode 0700; the default
+one is skipped (no shared cache) if it isn't.
+"""
+
+import functools
+import hashlib
+import os
+import pickle
+import stat
+import struct
+import tempfile
+import threading
+import time
+import uuid
+import warnings
+import zlib
+
+DEFAULT_TTL = 10 * 60
+# Seconds after which a single-flight lock its holder stopped refreshing counts as abandoned
+LOCK_TIMEOUT = 60
+POLL_INTERVAL = 0.1
+
+
+def content_hash(*parts):
+    """Stable hex digest of the inputs that determine a cached value."""
+    digest = hashlib.sha256()
+    for part in parts:
+        if type(part).__module__.startswith('pandas'):
+            import pandas as pd
+
+            digest.update(repr(part.columns if hasattr(part, 'columns') else part.name).encode())
+            digest.update(pd.util.hash_pandas_object(part, index=True).to_numpy().tobytes())
+        elif isinstance(part, bytes):
+            digest.update(part)
+        else:
+            digest.update(repr(part).encode())
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+class DiskCache:
+    """Cache entries as files in one directory, evicted least-recently-used past ``max_bytes``.
+
+    Each file is an 8-byte expiry timestamp followed by the payload. Writes go
+    to a temporary file and are renamed into place, so readers never see a
+    partial entry.
+    """
+
+    _header = struct.Struct('<d')
+
+    def __init__(self, directory, max_bytes=512 * 1024 * 1024):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        self._check_private(directory)
+
+    @staticmethod
+    def _check_private(directory):
+        """Refuse a directory other users could have planted entries in (they get unpickled)."""
+        info = os.lstat(directory)
+        if not stat.S_ISDIR(info.st_mode):
+            raise PermissionError(f"Cache directory {directory} is not a plain directory")
+        if hasattr(os, 'getuid') and (info.st_uid != os.getuid() or info.st_mode & 0o077):
+            raise PermissionError(f"Cache directory {directory} must be owned by this user with mode 0700")
+
+    def _path(self, key, suffix='.bin'):
+        return os.path.join(self.directory, key + suffix)
+
+    def get(self, key):
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None
+        (expires,) = self._header.unpack_from(data)
+        if expires < time.time():
+            self._remove(path)
+            return None
+        # Bump the modification time: eviction removes the least recently used files first
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        return data[self._header.size:]
+
+    def set(self, key, payload, ttl):
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(self._header.pack(time.time() + ttl))
+            f.write(payload)
+        os.replace(temp_path, self._path(key))
+        self._evict(keep=key)
+
+    def _evict(self, keep):
+        # The entry just written is never evicted, even if it alone is over max_bytes,
+        # or every worker would recompute it
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith('.bin') or name == keep + '.bin':
+                continue
+            try:
+                info = os.stat(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                continue
+            entries.append((info.st_mtime, info.st_size, name))
+        try:
+            total = os.stat(self._path(keep)).st_size
+        except FileNotFoundError:
+            total = 0
+        total += sum(size for _, size, _ in entries)
+        for _, size, name in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            self._remove(os.path.join(self.directory, name))
+            total -= size
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    def acquire_lock(self, key, timeout):
+        # O_EXCL creation is atomic on every platform the dashboard runs on
+        path = self._path(key, '.lock')
+        token = uuid.uuid4().hex
+        try:
+            fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            try:
+                stale = os.stat(path).st_mtime < time.time() - timeout
+            except FileNotFoundError:
+                stale = True
+            if stale:
+                # Holder died without releasing; clear it and let the next attempt win
+                self._remove(path)
+            return None
+        with os.fdopen(fd, 'w') as f:
+            f.write(token)
+        return token
+
+    def _owns_lock(self, path, token):
+        try:
+            with open(path) as f:
+                return f.read() == token
+        except FileNotFoundError:
+            return False
+
+    def refresh_lock(self, key, token, timeout):
+        # A lock counts as stale once its mtime is ``timeout`` old; touching it keeps it alive
+        path = self._path(key, '.lock')
+        if self._owns_lock(path, token):
+            os.utime(path)
+
+    def release_lock(self, key, token):
+        # Only delete the lock if it is still ours (it may have gone stale and been re-taken)
+        path = self._path(key, '.lock')
+        if self._owns_lock(path, token):
+            self._remove(path)
+
+
+class RedisCache:
+    """Cache entries in Redis; TTLs are native, LRU eviction comes from the
+    server's ``maxmemory-policy allkeys-lru``."""
+
+    def __init__(self, client, prefix='cm-dashboard:'):
+        self.client = client
+        self.prefix = prefix
+
+    @classmethod
+    def from_url(cls, url, **kwargs):
+        import redis
+
+        return cls(redis.Redis.from_url(url), **kwargs)
+
+    def get(self, key):
+        return self.client.get(self.prefix + key)
+
+    def set(self, key, payload, ttl):
+        self.client.set(self.prefix + key, payload, px=int(ttl * 1000))
+
+    def acquire_lock(self, key, timeout):
+        token = uuid.uuid4().hex
+        if self.client.set(self.prefix + 'lock:' + key, token, nx=True, px=int(timeout * 1000)):
+            return token
+        return None
+
+    def _if_lock_owned(self, key, token, action):
+        # Only touch the lock if it is still ours (it may have expired and been re-taken)
+        name = self.prefix + 'lock:' + key
+        with self.client.pipeline() as pipe:
+            try:
+                pipe.watch(name)
+                if pipe.get(name) == token.encode():
+                    pipe.multi()
+                    action(pipe, name)
+                    pipe.execute()
+            except Exception:
+                pass
+
+    def refresh_lock(self, key, token, timeout):
+        self._if_lock_owned(key, token, lambda pipe, name: pipe.pexpire(name, int(timeout * 1000)))
+
+    def release_lock(self, key, token):
+        self._if_lock_owned(key, token, lambda pipe, name: pipe.delete(name))
+
+
+class SharedCache:
+    def __init__(self, backend, namespace='v2', compress_level=6, lock_timeout=LOCK_TIMEOUT):
+        self.backend = backend
+        self.namespace = namespace
+        self.compress_level = compress_level
+        self.lock_timeout = lock_timeout
+
+    def key(self, name, *inputs):
+        return content_hash(self.namespace, name, *inputs)
+
+    def _load(self, key):
+        """The cached value, or None if it is missing or can't be read back."""
+        try:
+            payload = self.backend.get(key)
+            return None if payload is None else pickle.loads(zlib.decompress(payload))
+        except Exception as e:
+            warnings.warn(f"Shared cache read of {key} failed ({e!r}); computing instead")
+            return None
+
+    def _store(self, key, value, ttl):
+        try:
+            payload = zlib.compress(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), self.compress_level)
+            self.backend.set(key, payload, ttl)
+        except Exception as e:
+            warnings.warn(f"Shared cache write of {key} failed ({e!r})")
+
+    def _refresh_until(self, stop, key, token):
+        # Keep the lock alive while computing, however long that takes, so waiters
+        # keep waiting for our result instead of treating the lock as stale
+        while not stop.wait(self.lock_timeout / 3):
+            try:
+                self.backend.refresh_lock(key, token, self.lock_timeout)
+            except Exception:
+                pass
+
+    def _compute_holding_lock(self, key, token, compute, ttl):
+        stop = threading.Event()
+        refresher = threading.Thread(target=self._refresh_until, args=(stop, key, token), daemon=True)
+        refresher.start()
+        try:
+            # Another worker may have finished between our miss and taking the lock
+            value = self._load(key)
+            if value is None:
+                value = compute()
+                self._store(key, value, ttl)
+            return value
+        finally:
+            stop.set()
+            try:
+                self.backend.release_lock(key, token)
+            except Exception as e:
+                warnings.warn(f"Shared cache lock release of {key} failed ({e!r})")
+
+    def get_or_compute(self, name, inputs, compute, ttl=DEFAULT_TTL):
+        """Return the cached value for ``(name, *inputs)``, computing it at most once across workers.
+
+        ``compute`` must return something that is not None. If the backend fails
+        (e.g. Redis is down) the value is computed locally with a warning.
+        """
+        if self.backend is None:
+            return compute()
+        key = self.key(name, *inputs)
+        value = self._load(key)
+        if value is not None:
+            return value
+
+        while True:
+            try:
+                token = self.backend.acquire_lock(key, self.lock_timeout)
+            except Exception as e:
+                warnings.warn(f"Shared cache lock of {key} failed ({e!r}); computing without it")
+                return compute()
+            if token is not None:
+                return self._compute_holding_lock(key, token, compute, ttl)
+            # Someone else is computing it: wait for their result. Their lock is refreshed
+            # while they work and goes stale only if they die, at which point we take it over.
+            time.sleep(POLL_INTERVAL)
+            value = self._load(key)
+            if value is not None:
+                return value
+
+
+def backend_from_setting(setting):
+    if setting in ('off', 'none'):
+        return None
+    if setting.startswith(('redis://', 'rediss://', 'unix://')):
+        return RedisCache.from_url(setting)
+    if setting.startswith('disk:'):
+        setting = setting[len('disk:'):]
+    if setting:
+        return DiskCache(setting)
+    user = os.getuid() if hasattr(os, 'getuid') else os.environ.get('USERNAME', '')
+    try:
+        return DiskCache(os.path.join(tempfile.gettempdir(), f'cm-dashboard-cache-{user}'))
+    except PermissionError as e:
+        # Someone else got to the shared temp dir first: run without the cross-process cache
+        warnings.warn(f"{e}; cross-process cache disabled")
+        return None
+
+
+@functools.lru_cache(maxsize=1)
+def get_cache():
+    """The process-wide ``SharedCache`` configured by ``DASHBOARD_CACHE``."""
+    return SharedCache(backend_from_setting(os.environ.get('DASHBOARD_CACHE', 'disk:')))
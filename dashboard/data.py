@@ -0,0 +1,209 @@
+"""Data access for the dashboard: SQL Server connection, sample data and the shared dataset.
+
+Every script run leases the shared dataset (see shared_data.py), so pandas and
+numpy are always loaded; pyodbc is only imported when a real SQL Server
+connection is opened.
+"""
+
+import threading
+import time
+import uuid
+
+import streamlit as st
+
+
+# Database connection configuration
+def connect_to_sql_server():
+    try:
+        import pyodbc
+
+        connection_string = (
+            "Driver={ODBC Driver 17 for SQL Server};"
+            "Server=your_server_name;"
+            "Database=your_database_name;"
+            "UID=your_username;"
+            "PWD=your_password;"
+        )
+        conn = pyodbc.connect(connection_string)
+        return conn
+    except Exception as e:
+        st.error(f"Database connection failed: {e}")
+        return None
+
+# Reporting replica / snapshot for read-only analytics; None when it isn't reachable,
+# in which case reads go to the primary
+def connect_to_reporting_replica():
+    try:
+        import pyodbc
+
+        connection_string = (
+            "Driver={ODBC Driver 17 for SQL Server};"
+            "Server=your_replica_server_name;"
+            "Database=your_database_name;"
+            "UID=your_username;"
+            "PWD=your_password;"
+            "ApplicationIntent=ReadOnly;"
+        )
+        return pyodbc.connect(connection_string)
+    except Exception:
+        return None
+
+# Seconds the reporting replica may lag behind the primary before reads skip it
+REPLICA_MAX_STALENESS = 30
+
+# Heartbeat from reads every this many seconds; None when a scheduled job on the primary
+# bumps replication_heartbeat (see db_router.py), which keeps writes off the analytics path
+REPLICA_HEARTBEAT_INTERVAL = None
+
+# Sends analytics reads to the replica and writes to the primary (see db_router.py)
+@st.cache_resource
+def get_router():
+    from db_router import ReplicaRouter
+
+    return ReplicaRouter(connect_to_sql_server, connect_to_reporting_replica, REPLICA_MAX_STALENESS,
+                         REPLICA_HEARTBEAT_INTERVAL)
+
+# Pass st.session_state as ``session`` so a session reads its own writes. Note that the
+# pages don't read through here per session: load_source_data() loads one frame for all
+# sessions and keeps it for DATA_TTL, so a session's own write shows up in the pages only
+# after that reload, whichever database it reads from.
+def load_data_from_sql(session=None):
+    import pandas as pd
+
+    with get_router().read(session) as conn:
+        if conn:
+            query = "SELECT * FROM vehicle_sales"  # Replace with your table name
+            return pd.read_sql(query, conn)
+    return None
+
+# Writes return False when the primary isn't reachable (connect_to_sql_server shows the error)
+def insert_vehicle(vehicle_data, session=None):
+    query = '''INSERT INTO vehicle_sales 
+               (VehicleNumber, CustomerId, CustomerName, VehicleType, Model, 
+                PurchaseDate, Payment, PaymentMethod, EmployeeId, Status, 
+                RepairCost, RepairStatus) 
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)'''
+    try:
+        with get_router().write(session) as conn:
+            conn.cursor().execute(query, vehicle_data)
+    except ConnectionError:
+        return False
+    return True
+
+def update_vehicle(vehicle_number, update_data, session=None):
+    query = '''UPDATE vehicle_sales SET Status = ?, Payment = ?, 
+               CustomerId = ?, EmployeeId = ? WHERE VehicleNumber = ?'''
+    try:
+        with get_router().write(session) as conn:
+            conn.cursor().execute(query, list(update_data) + [vehicle_number])
+    except ConnectionError:
+        return False
+    return True
+
+# Sample data creation (replace with SQL data loading)
+def load_sample_data():
+    import numpy as np
+    import pandas as pd
+
+    # Vehicle models
+    bike_models = ['Dio', 'Pulsar', 'Fz', 'Ct100', 'Platina']
+    three_wheel_models = ['Auto Rickshaw', 'Three Wheeler']
+    
+    # Generate sample data
+    data = []
+    for i in range(1, 101):
+        vehicle_type = np.random.choice(['Bike', 'Three Wheeler'], p=[0.7, 0.3])
+        if vehicle_type == 'Bike':
+            model = np.random.choice(bike_models)
+            price_range = (400000, 600000)
+        else:
+            model = np.random.choice(three_wheel_models)
+            price_range = (800000, 1000000)
+        
+        data.append({
+            'VehicleNumber': f"ABC {np.random.randint(1000, 9999)}",
+            'CustomerId': i,
+            'CustomerName': f"Customer_{i}",
+            'VehicleType': vehicle_type,
+            'Model': model,
+            'PurchaseDate': pd.Timestamp.now() - pd.Timedelta(days=np.random.randint(0, 365*2)),
+            'Payment': np.random.randint(*price_range),
+            'PaymentMethod': np.random.choice(['Cash', 'Credit Card', 'Bank Transfer', 'Cheque']),
+            'EmployeeId': np.random.randint(1, 100),
+            'Status': np.random.choice(['Sold', 'Available', 'Under Repair']),
+            'RepairCost': np.random.randint(5000, 50000) if np.random.random() > 0.7 else 0,
+            'RepairStatus': np.random.choice(['Completed', 'In Progress', 'Pending']) if np.random.random() > 0.7 else 'None'
+        })
+    
+    return pd.DataFrame(data)
+
+# How long loaded data stays in the cross-process cache before a worker reloads it
+DATA_TTL = 10 * 60
+
+# Low-cardinality text columns, stored as categoricals so the KPI kernels can
+# bincount their integer codes directly
+CATEGORY_COLUMNS = ['VehicleType', 'Model', 'PaymentMethod', 'Status', 'RepairStatus']
+
+def prepare_dashboard_data(df):
+    return df.astype({column: 'category' for column in CATEGORY_COLUMNS if column in df.columns})
+
+# Load through the cross-process cache so replicas share one load instead of each running it.
+# Returns (frame, token): the token is minted with each load and cached alongside it, so every
+# worker holding the same load has the same token and rollups are keyed by the load they came from.
+def load_source_data():
+    from cache_backend import get_cache
+
+    def load():
+        return prepare_dashboard_data(load_sample_data()), uuid.uuid4().hex
+
+    return get_cache().get_or_compute('dashboard_data', ('sample', CATEGORY_COLUMNS), load, ttl=DATA_TTL)
+
+# One store per process; every session reads the same frame instead of its own copy
+@st.cache_resource
+def create_shared_store():
+    from shared_data import SharedStore
+
+    frame, token = load_source_data()
+    return SharedStore(frame, token)
+
+_refresh_lock = threading.Lock()
+
+# The shared store, re-read from the cross-process cache once it is DATA_TTL old and
+# republished if that is a different load (e.g. the entry expired and was reloaded)
+def get_shared_store():
+    store = create_shared_store()
+    if time.monotonic() - store.loaded_at < DATA_TTL or not _refresh_lock.acquire(blocking=False):
+        return store
+    try:
+        store.loaded_at = time.monotonic()
+        frame, token = load_source_data()
+        if token != store.current.fingerprint:
+            store.publish(frame, token)
+    finally:
+        _refresh_lock.release()
+    return store
+
+# The dataset version leased for the current script run (see shared_data.lease)
+def load_dataset():
+    from shared_data import leased_version
+
+    return leased_version() or get_shared_store().current
+
+# Single entry point the pages use, so swapping sample data for SQL is one change.
+# The frame is shared by all sessions and must be treated as read-only.
+def load_dashboard_data():
+    return load_dataset().frame
+
+# Swap in freshly loaded data for new script runs; runs in flight keep their version
+def publish_dashboard_data(frame):
+    return get_shared_store().publish(frame)
+
+# Rollup or figure derived from the current dataset: built once per process per version,
+# and once across processes through the shared cache
+def load_shared_rollup(name, build):
+    from cache_backend import get_cache
+
+    dataset = load_dataset()
+    return dataset.derived(
+        name, lambda frame: get_cache().get_or_compute(name, (dataset.fingerprint,), lambda: build(frame))
+    )
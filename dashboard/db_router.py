@@ -0,0 +1,151 @@
+"""Read/write routing between the primary database and a reporting replica.
+
+Writes (the management tabs' inserts and updates) always go to the primary.
+Read-only analytics go to the reporting replica or snapshot when it is fresh
+enough, and otherwise fall back to the primary.
+
+Freshness is tracked with the one-row ``replication_heartbeat`` table
+(migration 4). Every write bumps its ``Position`` and ``UpdatedAt`` in the
+same transaction, and a heartbeat bumps it on a timer, so the replica's copy
+of the row shows how far behind it is:
+
+- bounded staleness: the replica is used only if its ``UpdatedAt`` is at most
+  ``max_staleness`` seconds old
+- read your writes: a session that wrote remembers the ``Position`` of its
+  last write, and its reads skip the replica until the replica has caught up
+  to that position
+
+In production the heartbeat should run on the primary as a scheduled job
+(e.g. a SQL Server Agent job every 10 seconds), so the analytics path never
+writes to the primary::
+
+    UPDATE replication_heartbeat
+    SET Position = Position + 1,
+        UpdatedAt = DATEDIFF_BIG(MILLISECOND, '19700101', SYSUTCDATETIME()) / 1000.0
+    WHERE Id = 1
+
+Without such a job the replica looks stale once it has been idle for
+``max_staleness`` and reads fall back to the primary. Passing
+``heartbeat_interval`` makes the router beat from reads instead, opening a
+primary connection for the UPDATE at most once per interval; that is meant
+for setups without a job scheduler, such as the SQLite stand-in.
+
+Connection factories return a DB-API connection or None, so the same router
+works with pyodbc (SQL Server) and sqlite3 (two local files standing in for
+primary and replica).
+"""
+
+import contextlib
+import threading
+import time
+
+# Key in the session state (e.g. st.session_state) holding the session's last write position
+SESSION_KEY = '_db_router_write_position'
+
+
+class ReplicaRouter:
+    def __init__(self, connect_primary, connect_replica, max_staleness=30.0, heartbeat_interval=None,
+                 clock=time.time):
+        self.connect_primary = connect_primary
+        self.connect_replica = connect_replica
+        self.max_staleness = max_staleness
+        # Seconds between heartbeats sent from reads; None or 0 leaves the heartbeat to a scheduled job.
+        # Keep it well inside max_staleness so an idle but caught-up replica still counts as fresh.
+        self.heartbeat_interval = heartbeat_interval
+        self.clock = clock
+        self.routes = {'replica': 0, 'primary': 0}
+        self._last_heartbeat = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _position(conn):
+        cursor = conn.cursor()
+        cursor.execute("SELECT Position, UpdatedAt FROM replication_heartbeat WHERE Id = 1")
+        row = cursor.fetchone()
+        return (row[0], row[1]) if row else (0, 0.0)
+
+    def _beat(self, conn):
+        cursor = conn.cursor()
+        cursor.execute("UPDATE replication_heartbeat SET Position = Position + 1, UpdatedAt = ? WHERE Id = 1",
+                       (self.clock(),))
+        cursor.execute("SELECT Position FROM replication_heartbeat WHERE Id = 1")
+        return cursor.fetchone()[0]
+
+    def heartbeat(self, force=False):
+        """Bump the primary's heartbeat, unless ``heartbeat_interval`` hasn't passed since the last one."""
+        now = self.clock()
+        with self._lock:
+            if (not force and self.heartbeat_interval and self._last_heartbeat is not None
+                    and now - self._last_heartbeat < self.heartbeat_interval):
+                return
+            self._last_heartbeat = now
+        conn = self.connect_primary()
+        if conn is None:
+            return
+        try:
+            self._beat(conn)
+            conn.commit()
+        finally:
+            conn.close()
+
+    def replica_is_usable(self, replica, session=None):
+        position, updated_at = self._position(replica)
+        needed = session.get(SESSION_KEY, 0) if session is not None else 0
+        return position >= needed and self.clock() - updated_at <= self.max_staleness
+
+    def _read_connection(self, session):
+        try:
+            replica = self.connect_replica()
+        except Exception:
+            replica = None
+        if replica is not None:
+            try:
+                if self.replica_is_usable(replica, session):
+                    self.routes['replica'] += 1
+                    return replica
+            except Exception:
+                # Replica not migrated yet or unreachable mid-query: treat as unusable
+                pass
+            replica.close()
+        self.routes['primary'] += 1
+        return self.connect_primary()
+
+    @contextlib.contextmanager
+    def read(self, session=None):
+        """Connection for read-only queries: the replica when fresh enough for ``session``, else the primary.
+
+        Yields None if no database is reachable.
+        """
+        if self.heartbeat_interval:
+            try:
+                self.heartbeat()
+            except Exception:
+                pass
+        conn = self._read_connection(session)
+        try:
+            yield conn
+        finally:
+            if conn is not None:
+                conn.close()
+
+    @contextlib.contextmanager
+    def write(self, session=None):
+        """Primary connection for one write transaction, committed on exit.
+
+        The heartbeat is bumped in the same transaction and its position is
+        recorded in ``session`` so that session's later reads see the write.
+        """
+        conn = self.connect_primary()
+        if conn is None:
+            raise ConnectionError("Primary database is not reachable")
+        try:
+            yield conn
+            position = self._beat(conn)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+        if session is not None:
+            session[SESSION_KEY] = max(session.get(SESSION_KEY, 0), position)
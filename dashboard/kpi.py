@@ -0,0 +1,114 @@
+"""Single-pass KPI kernels for the Dashboard and Sales Reports pages.
+
+Instead of filtering the frame once per metric and running a separate
+``value_counts`` / ``groupby`` for every breakdown, each page's rows are
+mapped to one integer cell of a small cube (e.g. status x vehicle type x
+month) and counted / summed with ``np.bincount`` in a single pass. Every
+metric and breakdown on the page is then a marginal of that cube.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+def _codes(values):
+    """Integer codes and their (sorted) labels; categorical columns reuse their codes for free."""
+    if isinstance(values.dtype, pd.CategoricalDtype) and not values.isna().any():
+        categories = values.cat.categories
+        order = np.argsort(categories.to_numpy(), kind='stable')
+        codes = np.argsort(order)[values.cat.codes.to_numpy()]
+        return codes, categories.to_numpy()[order]
+    codes, labels = pd.factorize(np.asarray(values), sort=True, use_na_sentinel=False)
+    return codes, labels
+
+
+def _cube(key, shape, weights=None):
+    return np.bincount(key, weights=weights, minlength=int(np.prod(shape))).reshape(shape)
+
+
+def _weights(values):
+    """Float weights with NULLs counted as 0, like ``Series.sum()`` skipping them."""
+    return np.nan_to_num(values.to_numpy(dtype=float), nan=0.0)
+
+
+def _breakdown(totals, labels):
+    """``value_counts``-style Series: non-empty, non-null labels, largest first."""
+    series = pd.Series(totals, index=labels)
+    return series[(series > 0) & series.index.notna()].sort_values(ascending=False, kind='stable')
+
+
+class DashboardKPIs:
+    def __init__(self, df):
+        status, status_labels = _codes(df['Status'])
+        vehicle_type, type_labels = _codes(df['VehicleType'])
+        # Month 0-11, and 12 for vehicles without a PurchaseDate: they still count towards
+        # the totals but not the monthly trend (groupby used to drop them)
+        month = df['PurchaseDate'].dt.month.fillna(13).to_numpy(dtype=np.int64) - 1
+
+        shape = (len(status_labels), len(type_labels), 13)
+        key = (status * shape[1] + vehicle_type) * shape[2] + month
+        counts = _cube(key, shape)
+        payments = _cube(key, shape, _weights(df['Payment']))
+        repair_costs = _cube(key, shape, np.clip(_weights(df['RepairCost']), 0, None))
+
+        def status_slice(cube, name):
+            matches = np.flatnonzero(status_labels == name)
+            return cube[matches[0]] if len(matches) else np.zeros(shape[1:])
+
+        self.status_counts = _breakdown(counts.sum(axis=(1, 2)), status_labels)
+        self.total_sales = int(status_slice(counts, 'Sold').sum())
+        self.total_revenue = float(status_slice(payments, 'Sold').sum())
+        self.vehicles_under_repair = int(status_slice(counts, 'Under Repair').sum())
+        self.sold_by_vehicle_type = _breakdown(status_slice(counts, 'Sold').sum(axis=1), type_labels)
+        self.total_repair_cost = float(repair_costs.sum())
+
+        # Months (1-12, all years together) that have any vehicle
+        month_counts = counts.sum(axis=(0, 1))[:12]
+        present = month_counts > 0
+        self.monthly = pd.DataFrame({
+            'PurchaseDate': np.arange(1, 13)[present],
+            'Payment': payments.sum(axis=(0, 1))[:12][present],
+            'Count': month_counts[present],
+        })
+
+
+class SalesReportKPIs:
+    """Metrics for the sold vehicles at row positions ``rows`` of ``df``."""
+
+    def __init__(self, df, rows):
+        # A sale without a PurchaseDate can't fall in a date range
+        rows = rows[df['PurchaseDate'].notna().to_numpy()[rows]]
+        models, model_labels = _codes(df['Model'].iloc[rows])
+        methods, method_labels = _codes(df['PaymentMethod'].iloc[rows])
+        dates = df['PurchaseDate'].to_numpy()[rows].astype('datetime64[M]').astype(np.int64)
+        first_month = int(dates.min()) if len(rows) else 0
+        periods = dates - first_month
+        payment = df['Payment'].to_numpy(dtype=float)[rows]
+        paid = payment[~np.isnan(payment)]
+
+        shape = (int(periods.max()) + 1 if len(rows) else 0, len(model_labels), len(method_labels))
+        key = (periods * shape[1] + models) * shape[2] + methods
+        counts = _cube(key, shape)
+        payments = _cube(key, shape, np.nan_to_num(payment, nan=0.0))
+
+        self.total_sales = len(rows)
+        self.total_revenue = float(payments.sum())
+        model_totals = counts.sum(axis=(0, 2))
+        # Labels are sorted, so argmax breaks ties the same way as Series.mode()
+        self.top_model = model_labels[int(np.argmax(model_totals))] if len(rows) else None
+        self.model_sales = _breakdown(model_totals, model_labels)
+        self.payment_sales = _breakdown(counts.sum(axis=(0, 1)), method_labels)
+
+        month_counts = counts.sum(axis=(1, 2))
+        present = month_counts > 0
+        self.monthly = pd.DataFrame({
+            'PurchaseDate': (np.arange(shape[0])[present] + first_month).astype('datetime64[M]').astype(str),
+            'Payment': payments.sum(axis=(1, 2))[present],
+            'VehicleNumber': month_counts[present],
+        })
+
+        # Distinct counts and quantiles aren't cube marginals; they read just the selected columns
+        self.unique_customers = int(df['CustomerId'].iloc[rows].nunique())
+        self.median_payment, self.p90_payment = (
+            np.quantile(paid, [0.5, 0.9]) if len(paid) else (None, None)
+        )
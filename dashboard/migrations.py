@@ -0,0 +1,421 @@
+"""Versioned schema migrations for the dashboard database.
+
+Replaces the CREATE TABLE notes that used to sit at the bottom of
+dashbord.py. Each migration is applied once and recorded in
+``schema_migrations``. Statements are kept per dialect: ``mssql`` is the
+production SQL Server schema, ``sqlite`` is a local stand-in used to check
+that every dashboard query is served by an index.
+
+On SQL Server the aggregate views are indexed views (WITH SCHEMABINDING plus
+a unique clustered index). SQLite has no indexed views, so the stand-in keeps
+tables of the same name up to date with triggers.
+
+Usage:
+    python migrations.py                      # migrate SQL Server (connect_to_sql_server)
+    python migrations.py --sqlite local.db    # migrate a SQLite stand-in
+    python migrations.py --check              # migrate an in-memory SQLite DB and check query plans
+"""
+
+import argparse
+import contextlib
+import sys
+
+MIGRATIONS_TABLE = {
+    'mssql': """
+        IF OBJECT_ID(N'dbo.schema_migrations', N'U') IS NULL
+        CREATE TABLE schema_migrations (
+            Version INT PRIMARY KEY,
+            Description NVARCHAR(200) NOT NULL,
+            AppliedAt DATETIME2 NOT NULL DEFAULT SYSUTCDATETIME()
+        )""",
+    'sqlite': """
+        CREATE TABLE IF NOT EXISTS schema_migrations (
+            Version INTEGER PRIMARY KEY,
+            Description TEXT NOT NULL,
+            AppliedAt TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+        )""",
+}
+
+
+def _summary_triggers(table, key_columns, source_keys, values, when):
+    """SQLite triggers that keep ``table`` in step with inserts, updates and deletes on vehicle_sales.
+
+    ``source_keys`` / ``values`` are expressions over a row alias ``{row}`` (NEW or OLD);
+    ``values`` are the per-row contributions added to the summary's measure columns.
+    """
+    keys = ", ".join(key_columns)
+    measures = ", ".join(name for name, _ in values)
+
+    def apply(row, sign):
+        selected = ", ".join([key.format(row=row) for key in source_keys]
+                             + [f"{sign}{expr.format(row=row)}" for _, expr in values])
+        updates = ", ".join(f"{name} = {name} + excluded.{name}" for name, _ in values)
+        match = " AND ".join(f"{column} = {key.format(row=row)}" for column, key in zip(key_columns, source_keys))
+        return (f"INSERT INTO {table} ({keys}, {measures}) SELECT {selected} WHERE {when.format(row=row)} "
+                f"ON CONFLICT ({keys}) DO UPDATE SET {updates}; "
+                f"DELETE FROM {table} WHERE {match} AND {values[0][0]} = 0;")
+
+    return [
+        f"CREATE TRIGGER trg_{table}_insert AFTER INSERT ON vehicle_sales BEGIN {apply('NEW', '')} END",
+        f"CREATE TRIGGER trg_{table}_delete AFTER DELETE ON vehicle_sales BEGIN {apply('OLD', '-')} END",
+        f"CREATE TRIGGER trg_{table}_update AFTER UPDATE ON vehicle_sales BEGIN "
+        f"{apply('OLD', '-')} {apply('NEW', '')} END",
+    ]
+
+
+MIGRATIONS = [
+    {
+        'version': 1,
+        'description': "Base tables (repairs now carries its VehicleNumber foreign key)",
+        'mssql': [
+            """IF OBJECT_ID(N'dbo.vehicle_sales', N'U') IS NULL
+            CREATE TABLE vehicle_sales (
+                VehicleNumber NVARCHAR(50) PRIMARY KEY,
+                CustomerId INT,
+                CustomerName NVARCHAR(100),
+                VehicleType NVARCHAR(50),
+                Model NVARCHAR(50),
+                PurchaseDate DATE,
+                Payment DECIMAL(10,2),
+                PaymentMethod NVARCHAR(50),
+                EmployeeId INT,
+                Status NVARCHAR(50),
+                RepairCost DECIMAL(10,2),
+                RepairStatus NVARCHAR(50)
+            )""",
+            """IF OBJECT_ID(N'dbo.customers', N'U') IS NULL
+            CREATE TABLE customers (
+                CustomerId INT PRIMARY KEY IDENTITY(1,1),
+                FirstName NVARCHAR(50),
+                LastName NVARCHAR(50),
+                Address NVARCHAR(200),
+                NIC NVARCHAR(20),
+                Phone NVARCHAR(20)
+            )""",
+            """IF OBJECT_ID(N'dbo.suppliers', N'U') IS NULL
+            CREATE TABLE suppliers (
+                SupplierID INT PRIMARY KEY IDENTITY(1,1),
+                FirstName NVARCHAR(50),
+                LastName NVARCHAR(50),
+                Address NVARCHAR(200),
+                NIC NVARCHAR(20),
+                Phone NVARCHAR(20)
+            )""",
+            """IF OBJECT_ID(N'dbo.repairs', N'U') IS NULL
+            CREATE TABLE repairs (
+                RepairID INT PRIMARY KEY IDENTITY(1,1),
+                VehicleNumber NVARCHAR(50) NOT NULL,
+                RepairStartDate DATE,
+                RepairEndDate DATE,
+                RepairDetails NVARCHAR(500),
+                Location NVARCHAR(100),
+                RepairAmount DECIMAL(10,2),
+                RepairStatus NVARCHAR(50),
+                CONSTRAINT FK_repairs_vehicle_sales FOREIGN KEY (VehicleNumber) REFERENCES vehicle_sales(VehicleNumber)
+            )""",
+        ],
+        'sqlite': [
+            """CREATE TABLE vehicle_sales (
+                VehicleNumber TEXT PRIMARY KEY,
+                CustomerId INTEGER,
+                CustomerName TEXT,
+                VehicleType TEXT,
+                Model TEXT,
+                PurchaseDate TEXT,
+                Payment NUMERIC,
+                PaymentMethod TEXT,
+                EmployeeId INTEGER,
+                Status TEXT,
+                RepairCost NUMERIC,
+                RepairStatus TEXT
+            )""",
+            """CREATE TABLE customers (
+                CustomerId INTEGER PRIMARY KEY AUTOINCREMENT,
+                FirstName TEXT,
+                LastName TEXT,
+                Address TEXT,
+                NIC TEXT,
+                Phone TEXT
+            )""",
+            """CREATE TABLE suppliers (
+                SupplierID INTEGER PRIMARY KEY AUTOINCREMENT,
+                FirstName TEXT,
+                LastName TEXT,
+                Address TEXT,
+                NIC TEXT,
+                Phone TEXT
+            )""",
+            """CREATE TABLE repairs (
+                RepairID INTEGER PRIMARY KEY AUTOINCREMENT,
+                VehicleNumber TEXT NOT NULL REFERENCES vehicle_sales(VehicleNumber),
+                RepairStartDate TEXT,
+                RepairEndDate TEXT,
+                RepairDetails TEXT,
+                Location TEXT,
+                RepairAmount NUMERIC,
+                RepairStatus TEXT
+            )""",
+        ],
+    },
+    {
+        'version': 2,
+        'description': "Covering indexes for the dashboard filters and group-bys",
+        'mssql': [
+            # Dashboard KPIs, status pie, sales by vehicle type, active repairs
+            "CREATE INDEX IX_vehicle_sales_status_type ON vehicle_sales (Status, VehicleType) INCLUDE (Payment)",
+            # Sales Reports date range over sold vehicles
+            "CREATE INDEX IX_vehicle_sales_status_date ON vehicle_sales (Status, PurchaseDate) "
+            "INCLUDE (Payment, Model, PaymentMethod, CustomerId)",
+            # Dashboard monthly trend over all vehicles
+            "CREATE INDEX IX_vehicle_sales_purchase_date ON vehicle_sales (PurchaseDate) INCLUDE (Payment)",
+            # Vehicle Management filters
+            "CREATE INDEX IX_vehicle_sales_type_status_model ON vehicle_sales (VehicleType, Status, Model)",
+            # Customer list
+            "CREATE INDEX IX_vehicle_sales_customer ON vehicle_sales (CustomerId) INCLUDE (CustomerName)",
+            # Repair history (filtered index: only vehicles that had a repair)
+            "CREATE INDEX IX_vehicle_sales_repair_cost ON vehicle_sales (RepairCost) "
+            "INCLUDE (VehicleNumber, Model, RepairStatus) WHERE RepairCost > 0",
+            "CREATE INDEX IX_repairs_vehicle ON repairs (VehicleNumber)",
+        ],
+        'sqlite': [
+            "CREATE INDEX IX_vehicle_sales_status_type ON vehicle_sales (Status, VehicleType, Payment)",
+            "CREATE INDEX IX_vehicle_sales_status_date ON vehicle_sales "
+            "(Status, PurchaseDate, Payment, Model, PaymentMethod, CustomerId)",
+            "CREATE INDEX IX_vehicle_sales_purchase_date ON vehicle_sales (PurchaseDate, Payment)",
+            "CREATE INDEX IX_vehicle_sales_type_status_model ON vehicle_sales (VehicleType, Status, Model)",
+            "CREATE INDEX IX_vehicle_sales_customer ON vehicle_sales (CustomerId, CustomerName)",
+            "CREATE INDEX IX_vehicle_sales_repair_cost ON vehicle_sales "
+            "(RepairCost, VehicleNumber, Model, RepairStatus) WHERE RepairCost > 0",
+            "CREATE INDEX IX_repairs_vehicle ON repairs (VehicleNumber)",
+        ],
+    },
+    {
+        'version': 3,
+        'description': "Indexed aggregate views for daily sales and inventory status",
+        'mssql': [
+            """CREATE VIEW dbo.daily_sales_summary WITH SCHEMABINDING AS
+            SELECT PurchaseDate AS SaleDate, Model, PaymentMethod,
+                   COUNT_BIG(*) AS SaleCount, SUM(ISNULL(Payment, 0)) AS Revenue
+            FROM dbo.vehicle_sales
+            WHERE Status = N'Sold'
+            GROUP BY PurchaseDate, Model, PaymentMethod""",
+            "CREATE UNIQUE CLUSTERED INDEX IX_daily_sales_summary ON dbo.daily_sales_summary "
+            "(SaleDate, Model, PaymentMethod)",
+            """CREATE VIEW dbo.inventory_status_summary WITH SCHEMABINDING AS
+            SELECT Status, VehicleType,
+                   COUNT_BIG(*) AS VehicleCount, SUM(ISNULL(Payment, 0)) AS Revenue
+            FROM dbo.vehicle_sales
+            GROUP BY Status, VehicleType""",
+            "CREATE UNIQUE CLUSTERED INDEX IX_inventory_status_summary ON dbo.inventory_status_summary "
+            "(Status, VehicleType)",
+        ],
+        'sqlite': [
+            """CREATE TABLE daily_sales_summary (
+                SaleDate TEXT NOT NULL,
+                Model TEXT NOT NULL,
+                PaymentMethod TEXT NOT NULL,
+                SaleCount INTEGER NOT NULL,
+                Revenue NUMERIC NOT NULL,
+                PRIMARY KEY (SaleDate, Model, PaymentMethod)
+            ) WITHOUT ROWID""",
+            """INSERT INTO daily_sales_summary
+            SELECT PurchaseDate, IFNULL(Model, ''), IFNULL(PaymentMethod, ''), COUNT(*), SUM(IFNULL(Payment, 0))
+            FROM vehicle_sales
+            WHERE Status = 'Sold' AND PurchaseDate IS NOT NULL
+            GROUP BY 1, 2, 3""",
+            *_summary_triggers(
+                'daily_sales_summary', ['SaleDate', 'Model', 'PaymentMethod'],
+                ["{row}.PurchaseDate", "IFNULL({row}.Model, '')", "IFNULL({row}.PaymentMethod, '')"],
+                [('SaleCount', "1"), ('Revenue', "IFNULL({row}.Payment, 0)")],
+                when="{row}.Status = 'Sold' AND {row}.PurchaseDate IS NOT NULL",
+            ),
+            """CREATE TABLE inventory_status_summary (
+                Status TEXT NOT NULL,
+                VehicleType TEXT NOT NULL,
+                VehicleCount INTEGER NOT NULL,
+                Revenue NUMERIC NOT NULL,
+                PRIMARY KEY (Status, VehicleType)
+            ) WITHOUT ROWID""",
+            """INSERT INTO inventory_status_summary
+            SELECT IFNULL(Status, ''), IFNULL(VehicleType, ''), COUNT(*), SUM(IFNULL(Payment, 0))
+            FROM vehicle_sales
+            GROUP BY 1, 2""",
+            *_summary_triggers(
+                'inventory_status_summary', ['Status', 'VehicleType'],
+                ["IFNULL({row}.Status, '')", "IFNULL({row}.VehicleType, '')"],
+                [('VehicleCount', "1"), ('Revenue', "IFNULL({row}.Payment, 0)")],
+                when="1",
+            ),
+        ],
+    },
+    {
+        'version': 4,
+        'description': "Replication heartbeat for read/write routing (db_router.py)",
+        'mssql': [
+            """CREATE TABLE replication_heartbeat (
+                Id INT PRIMARY KEY,
+                Position BIGINT NOT NULL,
+                UpdatedAt FLOAT NOT NULL
+            )""",
+            "INSERT INTO replication_heartbeat (Id, Position, UpdatedAt) VALUES (1, 0, 0)",
+        ],
+        'sqlite': [
+            """CREATE TABLE replication_heartbeat (
+                Id INTEGER PRIMARY KEY,
+                Position INTEGER NOT NULL,
+                UpdatedAt REAL NOT NULL
+            )""",
+            "INSERT INTO replication_heartbeat (Id, Position, UpdatedAt) VALUES (1, 0, 0)",
+        ],
+    },
+]
+
+MONTH_EXPRESSION = {
+    'mssql': "MONTH(PurchaseDate)",
+    'sqlite': "CAST(strftime('%m', PurchaseDate) AS INTEGER)",
+}
+
+# SQL equivalents of what each dashboard page computes, with sample parameters
+DASHBOARD_QUERIES = {
+    'dashboard_sales_totals': (
+        "SELECT COUNT(*), SUM(Payment) FROM vehicle_sales WHERE Status = ?", ['Sold']),
+    'dashboard_status_counts': (
+        "SELECT Status, COUNT(*) FROM vehicle_sales GROUP BY Status", []),
+    'dashboard_sales_by_type': (
+        "SELECT VehicleType, COUNT(*) FROM vehicle_sales WHERE Status = ? GROUP BY VehicleType", ['Sold']),
+    'dashboard_monthly_sales': (
+        "SELECT {month}, SUM(Payment), COUNT(*) FROM vehicle_sales GROUP BY {month}", []),
+    'dashboard_inventory_summary': (
+        "SELECT VehicleType, VehicleCount, Revenue FROM inventory_status_summary WHERE Status = ?", ['Sold']),
+    'vehicle_filter': (
+        "SELECT * FROM vehicle_sales WHERE VehicleType = ? AND Status = ? AND Model = ?",
+        ['Bike', 'Available', 'Dio']),
+    'vehicle_available': (
+        "SELECT VehicleNumber FROM vehicle_sales WHERE Status = ?", ['Available']),
+    'customer_list': (
+        "SELECT DISTINCT CustomerId, CustomerName FROM vehicle_sales", []),
+    'active_repairs': (
+        "SELECT VehicleNumber, Model, RepairCost, RepairStatus FROM vehicle_sales WHERE Status = ?",
+        ['Under Repair']),
+    'repair_history': (
+        "SELECT VehicleNumber, Model, RepairCost, RepairStatus FROM vehicle_sales WHERE RepairCost > 0", []),
+    'repairs_for_vehicle': (
+        "SELECT * FROM repairs WHERE VehicleNumber = ?", ['ABC 1234']),
+    'sales_report_range': (
+        "SELECT PurchaseDate, Payment, Model, PaymentMethod, CustomerId FROM vehicle_sales "
+        "WHERE Status = ? AND PurchaseDate BETWEEN ? AND ?", ['Sold', '2025-01-01', '2025-12-31']),
+    'sales_report_daily_summary': (
+        "SELECT SaleDate, Model, PaymentMethod, SaleCount, Revenue FROM daily_sales_summary "
+        "WHERE SaleDate BETWEEN ? AND ?", ['2025-01-01', '2025-12-31']),
+}
+
+
+def dashboard_query(name, dialect='mssql'):
+    query, params = DASHBOARD_QUERIES[name]
+    return query.format(month=MONTH_EXPRESSION[dialect]), params
+
+
+def applied_versions(conn, dialect='mssql'):
+    cursor = conn.cursor()
+    cursor.execute(MIGRATIONS_TABLE[dialect])
+    conn.commit()
+    cursor.execute("SELECT Version FROM schema_migrations")
+    return {row[0] for row in cursor.fetchall()}
+
+
+@contextlib.contextmanager
+def _transaction(conn, dialect):
+    """Cursor whose statements are committed together or not at all."""
+    if dialect != 'sqlite':
+        cursor = conn.cursor()
+        try:
+            yield cursor
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        return
+    # sqlite3 only opens implicit transactions before DML, so CREATE TABLE/INDEX
+    # would autocommit one by one; take over and BEGIN explicitly instead
+    isolation_level, conn.isolation_level = conn.isolation_level, None
+    cursor = conn.cursor()
+    try:
+        cursor.execute("BEGIN")
+        try:
+            yield cursor
+            cursor.execute("COMMIT")
+        except Exception:
+            cursor.execute("ROLLBACK")
+            raise
+    finally:
+        conn.isolation_level = isolation_level
+
+
+def migrate(conn, dialect='mssql', target=None):
+    """Apply pending migrations up to ``target`` (default: latest); return the versions applied."""
+    done = applied_versions(conn, dialect)
+    applied = []
+    for migration in MIGRATIONS:
+        version = migration['version']
+        if version in done or (target is not None and version > target):
+            continue
+        with _transaction(conn, dialect) as cursor:
+            for statement in migration[dialect]:
+                cursor.execute(statement)
+            cursor.execute("INSERT INTO schema_migrations (Version, Description) VALUES (?, ?)",
+                           (version, migration['description']))
+        applied.append(version)
+    return applied
+
+
+def check_dashboard_indexes(conn):
+    """EXPLAIN QUERY PLAN every dashboard query on a migrated SQLite stand-in.
+
+    Returns ``{name: (uses_index, plan_lines)}``; a query fails when any step
+    scans a table without going through an index.
+    """
+    results = {}
+    for name in DASHBOARD_QUERIES:
+        query, params = dashboard_query(name, 'sqlite')
+        plan = [row[-1] for row in conn.execute("EXPLAIN QUERY PLAN " + query, params)]
+        full_scans = [step for step in plan if step.startswith('SCAN ') and ' USING ' not in step]
+        results[name] = (not full_scans, plan)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Apply dashboard schema migrations")
+    parser.add_argument('--sqlite', metavar='PATH', help="migrate a SQLite stand-in instead of SQL Server")
+    parser.add_argument('--check', action='store_true',
+                        help="check that every dashboard query uses an index (SQLite, in-memory by default)")
+    parser.add_argument('--target', type=int, help="stop at this schema version")
+    args = parser.parse_args(argv)
+
+    if args.sqlite or args.check:
+        import sqlite3
+
+        conn = sqlite3.connect(args.sqlite or ':memory:')
+        dialect = 'sqlite'
+    else:
+        from data import connect_to_sql_server
+
+        conn = connect_to_sql_server()
+        dialect = 'mssql'
+        if conn is None:
+            return 1
+
+    applied = migrate(conn, dialect, args.target)
+    print(f"Applied migrations: {applied or 'none (up to date)'}")
+
+    status = 0
+    if args.check:
+        for name, (uses_index, plan) in check_dashboard_indexes(conn).items():
+            print(f"{'OK  ' if uses_index else 'SCAN'} {name}: {' | '.join(plan)}")
+            if not uses_index:
+                status = 1
+    conn.close()
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
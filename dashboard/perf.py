@@ -0,0 +1,54 @@
+"""Script-execution timing for the dashboard.
+
+Streamlit re-executes ``dashbord.py`` on every interaction, so the cost that
+matters is (a) the first run in a fresh process (cold start, includes imports)
+and (b) each later rerun. Both are recorded per page in this module, which
+lives for the whole process, together with how many bytes each run
+materialised from the shared dataset (see shared_data.SessionUsage). Set
+``DASHBOARD_TIMINGS=1`` to show them under the page.
+"""
+
+import os
+import time
+
+SHOW_TIMINGS = os.environ.get('DASHBOARD_TIMINGS', '') not in ('', '0')
+
+# Keep only the most recent reruns per page
+MAX_SAMPLES = 50
+
+cold_start = None
+reruns = {}
+# Page -> (last, peak) bytes a session materialised from the shared dataset in one run
+session_memory = {}
+
+
+def record_run(page, started):
+    """Record a finished script run that began at ``time.perf_counter()`` value ``started``."""
+    global cold_start
+    elapsed = time.perf_counter() - started
+    if cold_start is None:
+        cold_start = (page, elapsed)
+    else:
+        samples = reruns.setdefault(page, [])
+        samples.append(elapsed)
+        del samples[:-MAX_SAMPLES]
+    return elapsed
+
+
+def record_memory(page, nbytes):
+    last, peak = session_memory.get(page, (0, 0))
+    session_memory[page] = (nbytes, max(peak, nbytes))
+
+
+def summary(page):
+    lines = []
+    if cold_start is not None:
+        lines.append(f"cold start ({cold_start[0]}): {cold_start[1] * 1000:.0f} ms")
+    samples = sorted(reruns.get(page, []))
+    if samples:
+        median = samples[len(samples) // 2]
+        lines.append(f"{page} reruns: median {median * 1000:.0f} ms, max {samples[-1] * 1000:.0f} ms (n={len(samples)})")
+    if page in session_memory:
+        last, peak = session_memory[page]
+        lines.append(f"session memory: {last / 1024:.0f} KB (peak {peak / 1024:.0f} KB)")
+    return " | ".join(lines)
@@ -0,0 +1,212 @@
+"""One read-only dataset shared by every dashboard session in the process.
+
+``SharedStore`` holds the current ``DatasetVersion``. Each script run leases
+the current version for its whole duration (so a run never sees two versions)
+and releases it at the end; ``publish`` swaps in a new version atomically and
+a retired version is dropped as soon as its last lease is released.
+
+Sessions never copy the shared frame. Filters return a ``DatasetView``, which
+is just an array of row positions into the shared columns; rows are only
+materialised when a page needs a real DataFrame (e.g. to display it), and
+that materialisation is charged against a per-session memory cap.
+"""
+
+import contextlib
+import contextvars
+import os
+import threading
+import time
+from concurrent.futures import Future
+
+import numpy as np
+
+# Bytes one session may materialise from the shared dataset in a single run
+SESSION_MEMORY_CAP = int(float(os.environ.get('DASHBOARD_SESSION_MEMORY_MB', '64')) * 1024 * 1024)
+
+_lease = contextvars.ContextVar('dashboard_dataset_lease', default=None)
+
+
+class DatasetVersion:
+    def __init__(self, number, frame, fingerprint=None):
+        self.number = number
+        self.frame = frame
+        self.refcount = 0
+        self._fingerprint = fingerprint
+        # Per-row cost of each column, used to size materialisations up front
+        rows = max(len(frame), 1)
+        self.row_bytes = (frame.memory_usage(deep=True, index=False) / rows).to_dict()
+        self._derived = {}
+        self._derived_lock = threading.Lock()
+
+    @property
+    def fingerprint(self):
+        """Identifies this data across processes (for shared cache keys): the token it was
+        loaded with, or else a content hash of the frame."""
+        if self._fingerprint is None:
+            from cache_backend import content_hash
+
+            self._fingerprint = content_hash(self.frame)
+        return self._fingerprint
+
+    def view(self):
+        return DatasetView(self, None)
+
+    def derived(self, name, build):
+        """Frame derived from this version, built once and shared by every session.
+
+        Only sessions asking for the same ``name`` wait for its build; the lock
+        just hands out one future per name and is never held while building.
+        """
+        with self._derived_lock:
+            future = self._derived.get(name)
+            building = future is None
+            if building:
+                future = self._derived[name] = Future()
+        if building:
+            try:
+                future.set_result(build(self.frame))
+            except BaseException as exc:
+                # Let a later run retry instead of caching the failure
+                with self._derived_lock:
+                    del self._derived[name]
+                future.set_exception(exc)
+                raise
+        return future.result()
+
+
+class DatasetView:
+    """Zero-copy selection of rows (``rows`` is None for all rows) of a ``DatasetVersion``."""
+
+    def __init__(self, version, rows):
+        self.version = version
+        self.rows = rows
+
+    def __len__(self):
+        return len(self.version.frame) if self.rows is None else len(self.rows)
+
+    def _narrow(self, rows):
+        # Row positions are the only per-session copy a view keeps; count them
+        usage = current_usage()
+        if usage is not None:
+            usage.charge(rows.nbytes)
+        return DatasetView(self.version, rows)
+
+    def mask(self, mask):
+        """Narrow to the rows where a boolean mask over the *full* dataset is true."""
+        mask = np.asarray(mask)
+        if self.rows is None:
+            return self._narrow(np.flatnonzero(mask))
+        return self._narrow(self.rows[mask[self.rows]])
+
+    def where(self, **equals):
+        """Narrow to rows where each ``column == value``; a value of None or "All" is ignored."""
+        view = self
+        for column, value in equals.items():
+            if value is None or value == "All":
+                continue
+            # Compare the Series (categoricals compare their integer codes) over the selected rows only
+            values = self.version.frame[column]
+            if view.rows is None:
+                view = view._narrow(np.flatnonzero((values == value).to_numpy()))
+            else:
+                view = view._narrow(view.rows[(values.take(view.rows) == value).to_numpy()])
+        return view
+
+    def column(self, name):
+        values = self.version.frame[name].to_numpy()
+        return values if self.rows is None else values[self.rows]
+
+    def frame(self, columns=None, capped=True):
+        """Materialise the selected rows.
+
+        Display frames are truncated to fit the session's memory cap; pass
+        ``capped=False`` for frames that feed a computation and must be complete
+        (they are still counted).
+        """
+        source = self.version.frame if columns is None else self.version.frame[columns]
+        row_bytes = sum(self.version.row_bytes[column] for column in source.columns)
+        usage = current_usage()
+        limit = len(self)
+        if usage is not None and capped:
+            limit = usage.rows_within_budget(row_bytes, len(self))
+        rows = np.arange(len(source)) if self.rows is None else self.rows
+        result = source.take(rows[:limit])
+        if usage is not None:
+            usage.charge(limit * row_bytes, truncated=limit < len(self))
+        return result
+
+
+class SessionUsage:
+    """Bytes materialised from the shared dataset during one script run."""
+
+    def __init__(self, cap=SESSION_MEMORY_CAP):
+        self.cap = cap
+        self.bytes = 0
+        self.truncated = False
+
+    def rows_within_budget(self, row_bytes, rows):
+        if row_bytes <= 0:
+            return rows
+        return max(0, min(rows, int((self.cap - self.bytes) // row_bytes)))
+
+    def charge(self, nbytes, truncated=False):
+        self.bytes += nbytes
+        self.truncated = self.truncated or truncated
+
+
+class SharedStore:
+    def __init__(self, frame, fingerprint=None):
+        self._lock = threading.Lock()
+        self._retired = []
+        self.current = DatasetVersion(1, frame, fingerprint)
+        # When the current frame was last (re)loaded, for callers that refresh it periodically
+        self.loaded_at = time.monotonic()
+
+    def publish(self, frame, fingerprint=None):
+        """Atomically make ``frame`` the dataset new runs see; running sessions keep their version."""
+        version = DatasetVersion(None, frame, fingerprint)
+        with self._lock:
+            version.number = self.current.number + 1
+            previous, self.current = self.current, version
+            self.loaded_at = time.monotonic()
+            if previous.refcount:
+                self._retired.append(previous)
+        return version
+
+    def acquire(self):
+        with self._lock:
+            self.current.refcount += 1
+            return self.current
+
+    def release(self, version):
+        with self._lock:
+            version.refcount -= 1
+            if version.refcount == 0 and version in self._retired:
+                self._retired.remove(version)
+
+    def live_versions(self):
+        with self._lock:
+            return [self.current.number] + [version.number for version in self._retired]
+
+
+@contextlib.contextmanager
+def lease(store, cap=SESSION_MEMORY_CAP):
+    """Pin the store's current version (and a fresh ``SessionUsage``) for one script run."""
+    version = store.acquire()
+    usage = SessionUsage(cap)
+    token = _lease.set((version, usage))
+    try:
+        yield version, usage
+    finally:
+        _lease.reset(token)
+        store.release(version)
+
+
+def leased_version():
+    leased = _lease.get()
+    return None if leased is None else leased[0]
+
+
+def current_usage():
+    leased = _lease.get()
+    return None if leased is None else leased[1]
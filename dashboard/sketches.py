@@ -0,0 +1,209 @@
+"""Mergeable streaming sketches used by the dashboard's approximate mode.
+
+- HyperLogLog: distinct counts (e.g. unique customers)
+- KLL: quantiles (e.g. payment median / 90th percentile)
+- Space-Saving: top-K frequent items (e.g. best selling models)
+
+Every sketch supports ``update`` with a batch of values and ``merge`` with
+another sketch of the same kind, so one sketch can be kept per time bucket
+and any date range answered by merging the buckets it covers.
+"""
+
+import random
+
+import numpy as np
+import pandas as pd
+
+
+def _hash64(values):
+    # Stable 64-bit hashes, vectorised for ints and strings alike (hash_array wants strings as objects)
+    values = np.asarray(values)
+    if values.dtype.kind in 'US':
+        values = values.astype(object)
+    return pd.util.hash_array(values, categorize=False)
+
+
+def _bit_length(words):
+    """Vectorised int.bit_length() for a uint64 array."""
+    length = np.zeros(words.shape, dtype=np.int64)
+    for shift in (32, 16, 8, 4, 2, 1):
+        big = words >= (np.uint64(1) << np.uint64(shift))
+        length[big] += shift
+        words = np.where(big, words >> np.uint64(shift), words)
+    return length + (words > 0)
+
+
+class HyperLogLog:
+    """Distinct-count estimator with relative standard error 1.04 / sqrt(2**p)."""
+
+    def __init__(self, p=12):
+        self.p = p
+        self.m = 1 << p
+        self.registers = np.zeros(self.m, dtype=np.uint8)
+
+    def update(self, values):
+        if len(values) == 0:
+            return
+        hashes = _hash64(values)
+        index = (hashes >> np.uint64(64 - self.p)).astype(np.int64)
+        rest = (hashes << np.uint64(self.p)) >> np.uint64(self.p)
+        rank = (64 - self.p) - _bit_length(rest) + 1
+        np.maximum.at(self.registers, index, rank.astype(np.uint8))
+
+    def merge(self, other):
+        if other.p != self.p:
+            raise ValueError("Cannot merge HyperLogLog sketches with different precision")
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+    def estimate(self):
+        m = self.m
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype(np.int64)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if raw <= 2.5 * m and zeros:
+            # Small-range correction (linear counting)
+            return m * np.log(m / zeros)
+        return float(raw)
+
+    @property
+    def relative_error(self):
+        return 1.04 / np.sqrt(self.m)
+
+
+class KLL:
+    """KLL quantile sketch (Karnin, Lang & Liberty).
+
+    Items at level ``h`` carry weight ``2**h``; a full level is sorted and
+    every other item is promoted to the next level.
+    """
+
+    def __init__(self, k=200, c=2 / 3, rng=None):
+        self.k = k
+        self.c = c
+        self.n = 0
+        self.levels = [np.empty(0)]
+        self._rng = rng or random.Random(0)
+
+    def _capacity(self, level):
+        depth = len(self.levels) - level - 1
+        return int(np.ceil(self.k * self.c ** depth)) + 1
+
+    def _size(self):
+        return sum(len(items) for items in self.levels)
+
+    def _max_size(self):
+        return sum(self._capacity(level) for level in range(len(self.levels)))
+
+    def _compress(self):
+        while self._size() >= self._max_size():
+            for level in range(len(self.levels)):
+                if len(self.levels[level]) >= self._capacity(level):
+                    if level + 1 == len(self.levels):
+                        self.levels.append(np.empty(0))
+                    items = np.sort(self.levels[level])
+                    paired = len(items) - len(items) % 2
+                    offset = self._rng.randint(0, 1)
+                    promoted = items[offset:paired:2]
+                    self.levels[level] = items[paired:]
+                    self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+                    break
+
+    def update(self, values):
+        values = np.asarray(values, dtype=float)
+        if len(values) == 0:
+            return
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self.n += len(values)
+        self._compress()
+
+    def merge(self, other):
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for level, items in enumerate(other.levels):
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self.n += other.n
+        self._compress()
+
+    def quantile(self, q):
+        if self.n == 0:
+            return None
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(level), 2 ** h, dtype=np.int64)
+                                  for h, level in enumerate(self.levels)])
+        order = np.argsort(items, kind='stable')
+        cumulative = np.cumsum(weights[order])
+        target = min(max(q, 0.0), 1.0) * cumulative[-1]
+        position = min(int(np.searchsorted(cumulative, target)), len(order) - 1)
+        return float(items[order[position]])
+
+    @property
+    def rank_error(self):
+        # Empirical normalised rank error (99% confidence) from the DataSketches KLL docs
+        return 2.296 / self.k ** 0.9723
+
+    def quantile_bounds(self, q):
+        """Value range that contains the true ``q`` quantile with ~99% confidence."""
+        eps = self.rank_error
+        return self.quantile(max(q - eps, 0.0)), self.quantile(min(q + eps, 1.0))
+
+
+class SpaceSaving:
+    """Top-K frequent items (Metwally et al.) with per-item error bounds.
+
+    For every tracked item ``counts[item]`` is an upper bound on its true
+    frequency and ``counts[item] - errors[item]`` a lower bound. ``floor``
+    bounds the frequency of any item that is not tracked.
+    """
+
+    def __init__(self, capacity=64):
+        self.capacity = capacity
+        self.counts = {}
+        self.errors = {}
+        self.floor = 0
+
+    def _untracked_bound(self):
+        if len(self.counts) < self.capacity:
+            return self.floor
+        return max(self.floor, min(self.counts.values()))
+
+    def update(self, values):
+        if len(values) == 0:
+            return
+        for item, count in pd.Series(values).value_counts().items():
+            self._add(item, int(count))
+
+    def _add(self, item, count):
+        if item in self.counts:
+            self.counts[item] += count
+        elif len(self.counts) < self.capacity:
+            self.counts[item] = self.floor + count
+            self.errors[item] = self.floor
+        else:
+            victim = min(self.counts, key=self.counts.get)
+            evicted = self.counts.pop(victim)
+            self.errors.pop(victim)
+            self.counts[item] = evicted + count
+            self.errors[item] = evicted
+
+    def merge(self, other):
+        mine, theirs = self._untracked_bound(), other._untracked_bound()
+        counts, errors = {}, {}
+        for item in self.counts.keys() | other.counts.keys():
+            counts[item] = self.counts.get(item, mine) + other.counts.get(item, theirs)
+            errors[item] = self.errors.get(item, mine) + other.errors.get(item, theirs)
+        ranked = sorted(counts, key=counts.get, reverse=True)
+        kept, dropped = ranked[:self.capacity], ranked[self.capacity:]
+        self.counts = {item: counts[item] for item in kept}
+        self.errors = {item: errors[item] for item in kept}
+        self.floor = max([mine + theirs] + [counts[item] for item in dropped])
+
+    def top(self, k=10):
+        """``[(item, estimate, lower_bound), ...]`` ordered by estimate."""
+        ranked = sorted(self.counts, key=self.counts.get, reverse=True)[:k]
+        return [(item, self.counts[item], self.counts[item] - self.errors[item]) for item in ranked]
+
+    def guaranteed(self, item):
+        """True if ``item`` is certainly more frequent than every other item."""
+        lower = self.counts[item] - self.errors[item]
+        others = [count for other, count in self.counts.items() if other != item]
+        return lower > max(others + [self._untracked_bound()])
@@ -0,0 +1,60 @@
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from approx import SalesSketches
+from data import prepare_dashboard_data
+
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(0)
+    n = 400
+    df = pd.DataFrame({
+        'CustomerId': rng.integers(1, 80, n).astype(float),
+        'Model': rng.choice(['Dio', 'Fz', 'Pulsar'], n, p=[0.6, 0.3, 0.1]),
+        'PurchaseDate': pd.Timestamp('2025-01-01') + pd.to_timedelta(rng.integers(0, 120, n), 'D'),
+        'Payment': rng.integers(1000, 5000, n).astype(float),
+        'PaymentMethod': rng.choice(['Cash', 'Cheque', 'Bank Transfer'], n),
+        'Status': rng.choice(['Sold', 'Available'], n),
+    })
+    df.loc[::9, 'Payment'] = np.nan
+    df.loc[::13, 'CustomerId'] = np.nan
+    df.loc[::31, 'PurchaseDate'] = pd.NaT
+    return prepare_dashboard_data(df)
+
+
+def test_summarize_matches_pandas_for_a_date_range(frame):
+    start, end = date(2025, 2, 1), date(2025, 3, 15)
+    summary = SalesSketches.from_frame(frame).summarize(start, end)
+    days = frame['PurchaseDate'].dt.date
+    sold = frame[(frame['Status'] == 'Sold') & (days >= start) & (days <= end)]
+
+    assert summary.count == len(sold)
+    assert summary.revenue == pytest.approx(sold['Payment'].sum())
+    assert dict(summary.payment_methods) == {k: v for k, v in sold['PaymentMethod'].value_counts().items() if v}
+
+    customers, error = summary.unique_customers()
+    assert abs(customers - sold['CustomerId'].nunique()) <= error
+
+    median, (low, high) = summary.payment_quantile(0.5)
+    assert low <= sold['Payment'].median() <= high
+    assert not np.isnan(summary.payment_quantile(0.9)[0])
+
+    top_model, guaranteed = summary.top_model()
+    assert top_model == sold['Model'].value_counts().idxmax() and guaranteed
+
+    by_month = sold.groupby(sold['PurchaseDate'].dt.strftime('%Y-%m'))['Payment'].agg(['sum', 'size'])
+    assert list(summary.monthly) == by_month.index.tolist()
+    for month, (revenue, count) in summary.monthly.items():
+        assert revenue == pytest.approx(by_month.loc[month, 'sum'])
+        assert count == by_month.loc[month, 'size']
+
+
+def test_payments_all_null_give_no_quantile(frame):
+    sold = frame[(frame['Status'] == 'Sold') & frame['PurchaseDate'].notna()].head(3).assign(Payment=np.nan)
+    summary = SalesSketches.from_frame(sold).summarize()
+    assert summary.count == 3
+    assert summary.payment_quantile(0.5)[0] is None
@@ -0,0 +1,158 @@
+import os
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+import cache_backend
+from cache_backend import DiskCache, RedisCache, SharedCache, content_hash
+from shared_data import SharedStore
+
+
+def make_frame(payment=1):
+    return pd.DataFrame({'Model': pd.Categorical(['Dio', 'Fz']), 'Payment': [payment, 2]})
+
+
+def test_content_hash_of_frames_series_and_published_versions():
+    frame = make_frame()
+    assert content_hash(frame) == content_hash(make_frame())
+    assert content_hash(frame) != content_hash(make_frame(payment=3))
+    assert content_hash(frame['Payment']) != content_hash(frame['Payment'].rename('Other'))
+
+    store = SharedStore(frame, 'token')
+    published = store.publish(make_frame(payment=3))
+    assert published.fingerprint == content_hash(make_frame(payment=3))
+    assert published.fingerprint != store.publish(frame).fingerprint
+
+
+def test_disk_cache_expires_entries(tmp_path):
+    cache = DiskCache(str(tmp_path / 'cache'))
+    cache.set('fresh', b'a', ttl=60)
+    cache.set('stale', b'b', ttl=-1)
+    assert cache.get('fresh') == b'a'
+    assert cache.get('stale') is None
+    assert not os.path.exists(cache._path('stale'))
+
+
+def test_disk_cache_evicts_least_recently_used(tmp_path):
+    cache = DiskCache(str(tmp_path / 'cache'), max_bytes=3 * (8 + 100))
+    for age, key in enumerate(['a', 'b', 'c']):
+        cache.set(key, bytes(100), ttl=60)
+        os.utime(cache._path(key), (1000 + age, 1000 + age))
+    cache.get('a')  # now the most recently used
+    cache.set('d', bytes(100), ttl=60)
+    assert cache.get('b') is None
+    assert all(cache.get(key) is not None for key in 'acd')
+
+
+def test_disk_cache_refuses_directories_others_can_write(tmp_path):
+    directory = tmp_path / 'shared'
+    directory.mkdir()
+    directory.chmod(0o777)
+    with pytest.raises(PermissionError):
+        DiskCache(str(directory))
+    directory.chmod(0o700)
+    DiskCache(str(directory))
+
+
+def test_default_disk_cache_is_private_and_skipped_when_not(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache_backend.tempfile, 'gettempdir', lambda: str(tmp_path))
+    backend = cache_backend.backend_from_setting('disk:')
+    assert os.stat(backend.directory).st_mode & 0o777 == 0o700
+
+    os.chmod(backend.directory, 0o755)
+    with pytest.warns(UserWarning):
+        assert cache_backend.backend_from_setting('disk:') is None
+
+
+def single_flight_calls(cache, threads=8):
+    calls = []
+
+    def compute():
+        calls.append(1)
+        time.sleep(0.3)
+        return 'value'
+
+    results = []
+    workers = [threading.Thread(target=lambda: results.append(cache.get_or_compute('rollup', ('v',), compute)))
+               for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(10)
+    assert results == ['value'] * threads
+    return len(calls)
+
+
+def test_disk_cache_single_flight(tmp_path):
+    assert single_flight_calls(SharedCache(DiskCache(str(tmp_path / 'cache')))) == 1
+
+
+def test_redis_cache_single_flight_and_ttl():
+    fakeredis = pytest.importorskip('fakeredis')
+    backend = RedisCache(fakeredis.FakeRedis())
+    assert single_flight_calls(SharedCache(backend)) == 1
+
+    backend.set('short', b'x', ttl=0.05)
+    assert backend.get('short') == b'x'
+    time.sleep(0.1)
+    assert backend.get('short') is None
+
+
+class BrokenClient:
+    """Redis client whose server is unreachable."""
+
+    def __getattr__(self, name):
+        def fail(*args, **kwargs):
+            raise ConnectionError("Error 111 connecting to 127.0.0.1:1. Connection refused.")
+        return fail
+
+
+def test_backend_failures_fall_back_to_computing():
+    cache = SharedCache(RedisCache(BrokenClient()))
+    with pytest.warns(UserWarning):
+        assert cache.get_or_compute('dashboard_data', ('sample',), lambda: 'value') == 'value'
+
+
+def test_corrupt_entries_are_recomputed(tmp_path):
+    cache = SharedCache(DiskCache(str(tmp_path / 'cache')))
+    cache.backend.set(cache.key('rollup', 'v'), b'not a zlib stream', ttl=60)
+    with pytest.warns(UserWarning):
+        assert cache.get_or_compute('rollup', ('v',), lambda: 'value') == 'value'
+    assert cache.get_or_compute('rollup', ('v',), lambda: 'recomputed') == 'value'
+
+
+def test_entry_over_the_size_limit_is_kept(tmp_path):
+    cache = DiskCache(str(tmp_path / 'cache'), max_bytes=100)
+    cache.set('small', bytes(50), ttl=60)
+    cache.set('big', bytes(500), ttl=60)
+    assert cache.get('big') == bytes(500)
+    assert cache.get('small') is None
+
+
+@pytest.mark.parametrize('backend', ['disk', 'redis'])
+def test_lock_is_refreshed_while_a_slow_value_is_computed(tmp_path, backend):
+    if backend == 'redis':
+        fakeredis = pytest.importorskip('fakeredis')
+        store = RedisCache(fakeredis.FakeRedis())
+    else:
+        store = DiskCache(str(tmp_path / 'cache'))
+    # Computing takes several lock timeouts; the waiters must not start their own computation
+    cache = SharedCache(store, lock_timeout=0.3)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        time.sleep(1.2)
+        return 'value'
+
+    results = []
+    workers = [threading.Thread(target=lambda: results.append(cache.get_or_compute('slow', (), compute)))
+               for _ in range(4)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(10)
+    assert results == ['value'] * 4
+    assert len(calls) == 1
@@ -0,0 +1,47 @@
+import pandas as pd
+
+import cache_backend
+import data
+import shared_data
+from cache_backend import DiskCache, SharedCache
+
+
+def test_rollups_follow_the_reloaded_data(tmp_path, monkeypatch):
+    cache = SharedCache(DiskCache(str(tmp_path / 'cache')))
+    monkeypatch.setattr(cache_backend, 'get_cache', lambda: cache)
+    loads = iter([pd.DataFrame({'Payment': [1, 2]}), pd.DataFrame({'Payment': [5, 5, 5]})])
+    monkeypatch.setattr(data, 'load_sample_data', lambda: next(loads))
+    data.create_shared_store.clear()
+
+    def total(frame):
+        return int(frame['Payment'].sum())
+
+    store = data.get_shared_store()
+    first = store.current
+    with shared_data.lease(store):
+        assert data.load_shared_rollup('total', total) == 3
+
+    # Still within DATA_TTL: the cached load is kept
+    assert data.get_shared_store().current is first
+
+    # The data entry expires and is reloaded: a new version, and rollups are rebuilt for it
+    cache.backend.set(cache.key('dashboard_data', 'sample', data.CATEGORY_COLUMNS), b'', ttl=-1)
+    store.loaded_at -= data.DATA_TTL
+    assert data.get_shared_store().current is not first
+    with shared_data.lease(store):
+        assert data.load_shared_rollup('total', total) == 15
+
+    # Data published directly is keyed by its content
+    data.publish_dashboard_data(pd.DataFrame({'Payment': [1, 2]}))
+    with shared_data.lease(store):
+        assert data.load_shared_rollup('total', total) == 3
+    data.create_shared_store.clear()
+
+
+def test_writes_return_false_without_a_primary(monkeypatch):
+    from db_router import ReplicaRouter
+
+    router = ReplicaRouter(lambda: None, lambda: None)
+    monkeypatch.setattr(data, 'get_router', lambda: router)
+    assert data.insert_vehicle(['ABC 1000'] + [None] * 11) is False
+    assert data.update_vehicle('ABC 1000', ['Sold', 100, 1, 1]) is False
@@ -0,0 +1,142 @@
+import sqlite3
+
+import pytest
+
+import migrations
+from db_router import SESSION_KEY, ReplicaRouter
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def databases(tmp_path):
+    primary, replica = str(tmp_path / 'primary.db'), str(tmp_path / 'replica.db')
+    conn = sqlite3.connect(primary)
+    migrations.migrate(conn, 'sqlite')
+    conn.close()
+    return primary, replica
+
+
+def replicate(primary, replica):
+    """Ship the primary's current state to the replica (sqlite3 online backup)."""
+    source, target = sqlite3.connect(primary), sqlite3.connect(replica)
+    source.backup(target)
+    source.close()
+    target.close()
+
+
+def make_router(primary, replica, clock):
+    return ReplicaRouter(lambda: sqlite3.connect(primary), lambda: sqlite3.connect(replica),
+                         max_staleness=30, clock=clock)
+
+
+def insert(conn, number, status='Available'):
+    conn.execute("INSERT INTO vehicle_sales (VehicleNumber, Status, Payment) VALUES (?, ?, 100)", (number, status))
+
+
+def vehicles(conn):
+    return [row[0] for row in conn.execute("SELECT VehicleNumber FROM vehicle_sales ORDER BY VehicleNumber")]
+
+
+def test_reads_use_a_fresh_replica_and_fall_back_when_it_is_stale(databases):
+    primary, replica = databases
+    clock = Clock()
+    router = make_router(primary, replica, clock)
+    router.heartbeat(force=True)
+    replicate(primary, replica)
+
+    with router.read() as conn:
+        assert vehicles(conn) == []
+    assert router.routes == {'replica': 1, 'primary': 0}
+
+    # Replication stops; once the replica's heartbeat is older than max_staleness reads skip it
+    clock.now += 31
+    with router.read() as conn:
+        assert vehicles(conn) == []
+    assert router.routes == {'replica': 1, 'primary': 1}
+
+    # The scheduled heartbeat job runs again and the replica catches up
+    router.heartbeat(force=True)
+    replicate(primary, replica)
+    with router.read():
+        pass
+    assert router.routes == {'replica': 2, 'primary': 1}
+
+
+def heartbeat_position(path):
+    conn = sqlite3.connect(path)
+    position = conn.execute("SELECT Position FROM replication_heartbeat").fetchone()[0]
+    conn.close()
+    return position
+
+
+def test_reads_only_write_a_heartbeat_when_asked_to(databases):
+    primary, replica = databases
+    clock = Clock()
+    with make_router(primary, replica, clock).read():
+        pass
+    assert heartbeat_position(primary) == 0
+
+    router = ReplicaRouter(lambda: sqlite3.connect(primary), lambda: sqlite3.connect(replica),
+                           max_staleness=30, heartbeat_interval=10, clock=clock)
+    for _ in range(3):
+        with router.read():
+            pass
+    assert heartbeat_position(primary) == 1
+    clock.now += 10
+    with router.read():
+        pass
+    assert heartbeat_position(primary) == 2
+
+
+def test_a_session_reads_its_own_writes(databases):
+    primary, replica = databases
+    router = make_router(primary, replica, Clock())
+    router.heartbeat(force=True)
+    replicate(primary, replica)
+
+    writer, other = {}, {}
+    with router.write(writer) as conn:
+        insert(conn, 'ABC 1000')
+    assert writer[SESSION_KEY] > 0
+
+    # The replica hasn't caught up: the writer is sent to the primary, other sessions may read the replica
+    with router.read(writer) as conn:
+        assert vehicles(conn) == ['ABC 1000']
+    with router.read(other) as conn:
+        assert vehicles(conn) == []
+
+    replicate(primary, replica)
+    with router.read(writer) as conn:
+        assert vehicles(conn) == ['ABC 1000']
+    assert router.routes == {'replica': 2, 'primary': 1}
+
+
+def test_a_failed_write_is_rolled_back(databases):
+    primary, replica = databases
+    router = make_router(primary, replica, Clock())
+    session = {}
+    with pytest.raises(sqlite3.IntegrityError):
+        with router.write(session) as conn:
+            insert(conn, 'ABC 1000')
+            insert(conn, 'ABC 1000')
+
+    conn = sqlite3.connect(primary)
+    assert vehicles(conn) == []
+    assert conn.execute("SELECT Position FROM replication_heartbeat").fetchone()[0] == 0
+    conn.close()
+    assert SESSION_KEY not in session
+
+
+def test_a_missing_replica_sends_reads_to_the_primary(databases):
+    primary, _ = databases
+    router = ReplicaRouter(lambda: sqlite3.connect(primary), lambda: None, clock=Clock())
+    with router.read() as conn:
+        assert vehicles(conn) == []
+    assert router.routes == {'replica': 0, 'primary': 1}
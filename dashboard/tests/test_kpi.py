@@ -0,0 +1,65 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from data import prepare_dashboard_data
+from kpi import DashboardKPIs, SalesReportKPIs
+
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(0)
+    n = 500
+    df = pd.DataFrame({
+        'CustomerId': rng.integers(1, 50, n).astype(float),
+        'VehicleType': rng.choice(['Bike', 'Three Wheeler'], n),
+        'Model': rng.choice(['Dio', 'Fz', 'Pulsar'], n),
+        'PurchaseDate': pd.Timestamp('2025-01-01') + pd.to_timedelta(rng.integers(0, 500, n), 'D'),
+        'Payment': rng.integers(1000, 5000, n).astype(float),
+        'PaymentMethod': rng.choice(['Cash', 'Cheque'], n),
+        'Status': rng.choice(['Sold', 'Available', 'Under Repair'], n),
+        'RepairCost': rng.integers(0, 100, n).astype(float),
+    })
+    # NULLs the schema allows
+    df.loc[::7, 'PurchaseDate'] = pd.NaT
+    df.loc[::11, 'Payment'] = np.nan
+    df.loc[::13, 'RepairCost'] = np.nan
+    df.loc[::17, 'CustomerId'] = np.nan
+    return prepare_dashboard_data(df)
+
+
+def test_dashboard_kpis_skip_nulls_like_pandas(frame):
+    kpis = DashboardKPIs(frame)
+    sold = frame[frame['Status'] == 'Sold']
+    assert kpis.status_counts.to_dict() == frame['Status'].value_counts().to_dict()
+    assert kpis.total_sales == len(sold)
+    assert kpis.total_revenue == pytest.approx(sold['Payment'].sum())
+    assert kpis.total_repair_cost == pytest.approx(frame['RepairCost'].clip(lower=0).sum())
+    assert kpis.sold_by_vehicle_type.to_dict() == sold['VehicleType'].value_counts().to_dict()
+
+    monthly = frame.groupby(frame['PurchaseDate'].dt.month).agg(Payment=('Payment', 'sum'),
+                                                                  Count=('Payment', 'size'))
+    assert kpis.monthly['PurchaseDate'].tolist() == monthly.index.astype(int).tolist()
+    assert kpis.monthly['Count'].tolist() == monthly['Count'].tolist()
+    np.testing.assert_allclose(kpis.monthly['Payment'], monthly['Payment'])
+
+
+def test_sales_report_kpis_skip_nulls_like_pandas(frame):
+    rows = np.flatnonzero((frame['Status'] == 'Sold').to_numpy())
+    kpis = SalesReportKPIs(frame, rows)
+    sold = frame.iloc[rows]
+    dated = sold[sold['PurchaseDate'].notna()]
+    assert kpis.total_sales == len(dated)
+    assert kpis.total_revenue == pytest.approx(dated['Payment'].sum())
+    assert kpis.unique_customers == dated['CustomerId'].nunique()
+    assert kpis.median_payment == pytest.approx(dated['Payment'].median())
+    assert kpis.model_sales.to_dict() == dated['Model'].value_counts().to_dict()
+    assert kpis.monthly['VehicleNumber'].sum() == len(dated)
+
+
+def test_sales_report_without_any_payment_has_no_quantiles(frame):
+    rows = np.flatnonzero(((frame['Status'] == 'Sold') & frame['PurchaseDate'].notna()).to_numpy())[:1]
+    kpis = SalesReportKPIs(frame.assign(Payment=np.nan), rows)
+    assert kpis.total_sales == 1
+    assert kpis.total_revenue == 0
+    assert kpis.median_payment is None and kpis.p90_payment is None
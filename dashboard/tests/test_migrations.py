@@ -0,0 +1,28 @@
+import sqlite3
+
+import pytest
+
+import migrations
+
+
+def test_migrates_sqlite_and_every_dashboard_query_uses_an_index():
+    conn = sqlite3.connect(':memory:')
+    assert migrations.migrate(conn, 'sqlite') == [m['version'] for m in migrations.MIGRATIONS]
+    assert migrations.migrate(conn, 'sqlite') == []
+    for name, (uses_index, plan) in migrations.check_dashboard_indexes(conn).items():
+        assert uses_index, (name, plan)
+
+
+def test_failed_migration_is_rolled_back(monkeypatch):
+    conn = sqlite3.connect(':memory:')
+    broken = dict(migrations.MIGRATIONS[0], sqlite=migrations.MIGRATIONS[0]['sqlite'] + ["CREATE TABLE ("])
+    monkeypatch.setattr(migrations, 'MIGRATIONS', [broken] + migrations.MIGRATIONS[1:])
+    with pytest.raises(sqlite3.OperationalError):
+        migrations.migrate(conn, 'sqlite')
+
+    tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    assert tables == {'schema_migrations'}
+    assert migrations.applied_versions(conn, 'sqlite') == set()
+
+    monkeypatch.undo()
+    assert migrations.migrate(conn, 'sqlite') == [m['version'] for m in migrations.MIGRATIONS]
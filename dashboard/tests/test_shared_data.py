@@ -0,0 +1,84 @@
+import threading
+
+import pandas as pd
+
+import shared_data
+from shared_data import SharedStore
+
+
+def make_frame():
+    return pd.DataFrame({
+        'Status': pd.Categorical(['Sold', 'Available', 'Sold', 'Under Repair', 'Sold']),
+        'Model': ['Dio', 'Fz', 'Fz', 'Dio', 'Dio'],
+        'Payment': [1, 2, 3, 4, 5],
+    })
+
+
+def test_where_filters_categoricals_and_narrowed_views():
+    store = SharedStore(make_frame())
+    with shared_data.lease(store) as (dataset, usage):
+        sold = dataset.view().where(Status='Sold', Model='All')
+        assert sold.rows.tolist() == [0, 2, 4]
+        assert sold.where(Model='Dio').rows.tolist() == [0, 4]
+        assert dataset.view().where(Status='Missing').rows.tolist() == []
+        assert usage.bytes > 0
+
+
+def test_derived_builds_do_not_block_each_other():
+    version = SharedStore(make_frame()).current
+    slow_started, release_slow = threading.Event(), threading.Event()
+    builds = []
+
+    def slow_build(frame):
+        builds.append('slow')
+        slow_started.set()
+        release_slow.wait(5)
+        return 'slow'
+
+    waiter = threading.Thread(target=version.derived, args=('slow', slow_build))
+    waiter.start()
+    assert slow_started.wait(5)
+    # A different rollup is built while 'slow' is still in progress
+    assert version.derived('fast', lambda frame: len(frame)) == 5
+
+    second = threading.Thread(target=version.derived, args=('slow', slow_build))
+    second.start()
+    release_slow.set()
+    waiter.join(5)
+    second.join(5)
+    assert builds == ['slow']
+    assert version.derived('slow', slow_build) == 'slow'
+
+
+def test_publish_keeps_leased_versions_until_released():
+    store = SharedStore(make_frame())
+    with shared_data.lease(store) as (first, _):
+        second = store.publish(make_frame().assign(Payment=0))
+        assert store.current is second and second.number == 2
+        assert store.live_versions() == [2, 1]
+        # New runs lease the new version; the running one keeps its own
+        with shared_data.lease(store) as (leased, _):
+            assert leased is second
+            assert shared_data.leased_version() is second
+        assert shared_data.leased_version() is first
+        assert first.refcount == 1
+    assert first.refcount == 0
+    assert store.live_versions() == [2]
+
+    # A version nobody leased is dropped as soon as it is replaced
+    store.publish(make_frame())
+    assert store.live_versions() == [3]
+
+
+def test_frame_is_truncated_at_the_session_cap():
+    frame = pd.DataFrame({'Payment': range(1000)})
+    store = SharedStore(frame)
+    with shared_data.lease(store, cap=100 * 8) as (dataset, usage):
+        assert len(dataset.view().frame(capped=False)) == 1000
+        assert not usage.truncated
+    with shared_data.lease(store, cap=100 * 8) as (dataset, usage):
+        shown = dataset.view().frame()
+        assert len(shown) == 100
+        assert shown['Payment'].tolist() == list(range(100))
+        assert usage.truncated and usage.bytes == 100 * 8
+        assert len(dataset.view().frame()) == 0
@@ -0,0 +1,64 @@
+import random
+
+import numpy as np
+import pytest
+
+from sketches import KLL, HyperLogLog, SpaceSaving
+
+
+def test_hyperloglog_merge_stays_within_its_error():
+    left, right = HyperLogLog(), HyperLogLog()
+    left.update(np.arange(0, 60_000))
+    right.update(np.arange(30_000, 100_000))
+    left.merge(right)
+    assert abs(left.estimate() - 100_000) <= 3 * left.relative_error * 100_000
+
+    small = HyperLogLog()
+    small.update(np.array(['a', 'b', 'c', 'a']))
+    assert round(small.estimate()) == 3
+
+    with pytest.raises(ValueError):
+        left.merge(HyperLogLog(p=10))
+
+
+def test_kll_merged_quantiles_fall_within_their_bounds():
+    values = np.random.default_rng(0).normal(50_000, 10_000, 100_000)
+    merged = KLL(rng=random.Random(1))
+    for chunk in np.array_split(values, 20):
+        part = KLL(rng=random.Random(2))
+        part.update(chunk)
+        merged.merge(part)
+    assert merged.n == len(values)
+
+    ordered = np.sort(values)
+    for q in (0.1, 0.5, 0.9, 0.99):
+        low, high = merged.quantile_bounds(q)
+        assert low <= np.quantile(values, q) <= high
+        rank = np.searchsorted(ordered, merged.quantile(q)) / len(values)
+        assert abs(rank - q) <= merged.rank_error
+
+    assert KLL().quantile(0.5) is None
+
+
+def test_space_saving_merge_bounds_and_guarantee():
+    rng = np.random.default_rng(0)
+    left_items = rng.choice(50, 5_000, p=np.r_[0.3, np.full(49, 0.7 / 49)])
+    right_items = rng.choice(50, 5_000)
+    left, right = SpaceSaving(capacity=10), SpaceSaving(capacity=10)
+    left.update(left_items)
+    right.update(right_items)
+    left.merge(right)
+
+    truth = np.bincount(np.concatenate([left_items, right_items]), minlength=50)
+    for item, estimate, lower in left.top(10):
+        assert lower <= truth[item] <= estimate
+    untracked = [item for item in range(50) if item not in left.counts]
+    assert all(truth[item] <= left._untracked_bound() for item in untracked)
+
+    top_item = left.top(1)[0][0]
+    assert top_item == 0 and left.guaranteed(top_item)
+    assert not left.guaranteed(left.top(2)[1][0])
+
+    tie = SpaceSaving()
+    tie.update(['Dio', 'Fz'])
+    assert not tie.guaranteed('Dio')
@@ -0,0 +1,23 @@
+"""Per-page modules for the dashboard.
+
+Each page lives in its own module exposing ``render()``. A module is only
+imported the first time its page is visited; after that Python's module
+cache keeps it, so a rerun only executes the active page's ``render()``.
+"""
+
+import importlib
+
+# Page key (stored in st.session_state.current_page) -> module name
+PAGES = {
+    'dashboard': 'views.dashboard',
+    'vehicle_management': 'views.vehicle_management',
+    'customer_management': 'views.customer_management',
+    'repair_management': 'views.repair_management',
+    'supplier_management': 'views.supplier_management',
+    'sales_reports': 'views.sales_reports',
+}
+
+
+def render_page(page):
+    module = importlib.import_module(PAGES.get(page, PAGES['dashboard']))
+    module.render()
@@ -0,0 +1,65 @@
+"""Customer Management page."""
+
+import numpy as np
+import streamlit as st
+
+from data import load_dataset
+
+
+# Generate customer data (built once per dataset version and shared by all sessions)
+def build_customers(df):
+    customers = df[['CustomerId', 'CustomerName']].drop_duplicates()
+    customers['Phone'] = [f"07{np.random.randint(10000000, 99999999)}" for _ in range(len(customers))]
+    customers['Address'] = [f"Address {i}" for i in customers['CustomerId']]
+    customers['NIC'] = [f"{np.random.randint(100000000, 999999999)}V" for _ in range(len(customers))]
+    return customers
+
+
+def render():
+    customers = load_dataset().derived('customers', build_customers)
+
+    st.title("Customer Management")
+    
+    tab1, tab2, tab3 = st.tabs(["All Customers", "Add Customer", "Update Customer"])
+    
+    with tab1:
+        st.dataframe(customers, use_container_width=True)
+    
+    with tab2:
+        st.subheader("Add New Customer")
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            first_name = st.text_input("First Name")
+            address = st.text_area("Address")
+            nic_number = st.text_input("NIC Number")
+        
+        with col2:
+            last_name = st.text_input("Last Name")
+            phone_number = st.text_input("Phone Number")
+        
+        if st.button("Add Customer", type="primary"):
+            st.success("Customer added successfully!")
+    
+    with tab3:
+        st.subheader("Update Customer")
+        customer_to_update = st.selectbox("Select Customer", customers['CustomerName'].tolist())
+        
+        if customer_to_update:
+            col1, col2 = st.columns(2)
+            with col1:
+                st.text_input("First Name", value="Sample", key="update_fname")
+                st.text_area("Address", value="Sample Address", key="update_address")
+                st.text_input("NIC Number", value="123456789V", key="update_nic")
+            
+            with col2:
+                st.text_input("Last Name", value="Customer", key="update_lname")
+                st.text_input("Phone Number", value="0771234567", key="update_phone")
+            
+            col1, col2 = st.columns(2)
+            with col1:
+                if st.button("Delete Customer", type="secondary"):
+                    st.warning("Customer deleted!")
+            with col2:
+                if st.button("Save Changes", type="primary"):
+                    st.success("Customer updated successfully!")
@@ -0,0 +1,179 @@
+"""Dashboard page: headline KPIs and overview charts."""
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+import plotly.express as px
+import plotly.graph_objects as go
+
+from approx import approximate_mode_toggle, load_sales_summary
+from data import load_dashboard_data, load_shared_rollup
+from kpi import DashboardKPIs
+
+
+def monthly_sales_figure(kpis):
+    monthly_sales = kpis.monthly[['PurchaseDate', 'Payment']].copy()
+    monthly_sales['Month'] = pd.to_datetime(monthly_sales['PurchaseDate'], format='%m').dt.strftime('%b')
+
+    fig = px.line(monthly_sales, x='Month', y='Payment', 
+                 title="Monthly Sales Trend",
+                 color_discrete_sequence=['#9467bd'])
+    fig.update_layout(showlegend=False, height=400)
+    return fig
+
+
+def monthly_count_figure(kpis):
+    monthly_count = kpis.monthly[['PurchaseDate', 'Count']].copy()
+    monthly_count['Month'] = pd.to_datetime(monthly_count['PurchaseDate'], format='%m').dt.strftime('%b')
+
+    fig = px.bar(monthly_count, x='Month', y='Count', 
+                title="Monthly Vehicle Sales Count",
+                color_discrete_sequence=['#ff7f0e'])
+    fig.update_layout(showlegend=False, height=400)
+    return fig
+
+
+def vehicle_type_figure(kpis):
+    vehicle_sales = kpis.sold_by_vehicle_type
+
+    fig = go.Figure()
+    for i, (vehicle_type, count) in enumerate(vehicle_sales.items()):
+        fig.add_trace(go.Bar(
+            x=[vehicle_type],
+            y=[count],
+            name=vehicle_type,
+            marker_color=['#1f77b4', '#ff7f0e'][i % 2],
+            text=[count],
+            textposition='auto'
+        ))
+
+    fig.update_layout(
+        showlegend=False,
+        height=400,
+        xaxis_title="Vehicle Type",
+        yaxis_title="Sales Count"
+    )
+    return fig
+
+
+def inventory_figure(kpis):
+    status_counts = kpis.status_counts
+
+    # Create custom labels with count values
+    labels = []
+    values = []
+    for status, count in status_counts.items():
+        labels.append(f"{status}")
+        values.append(count)
+
+    fig = px.pie(
+        values=values, 
+        names=labels,
+        color_discrete_sequence=['#ff9999', '#66b3ff', '#99ff99'],
+        title="Inventory Distribution"
+    )
+
+    # Update traces to show count values instead of percentages
+    fig.update_traces(
+        textposition='inside', 
+        textinfo='value+label',
+        textfont_size=12,
+        marker=dict(line=dict(color='#FFFFFF', width=2))
+    )
+
+    fig.update_layout(
+        height=400, 
+        showlegend=True,
+        legend=dict(
+            orientation="v",
+            yanchor="middle",
+            y=0.5,
+            xanchor="left",
+            x=1.01
+        ),
+        margin=dict(l=0, r=0, t=40, b=0)
+    )
+    return fig
+
+
+def load_figure(name, build, kpis):
+    return load_shared_rollup(f'dashboard_{name}', lambda df: build(kpis))
+
+
+def render():
+    df = load_dashboard_data()
+    # Every metric and breakdown on this page, from one pass over the data
+    kpis = load_shared_rollup('dashboard_kpis', DashboardKPIs)
+
+    st.markdown('<h1 style="text-align: center; color: #1f77b4; margin-bottom: 2rem;">Admin Dashboard</h1>', unsafe_allow_html=True)
+    
+    approximate = approximate_mode_toggle(df, key="dashboard_approx")
+    if approximate:
+        summary = load_sales_summary()
+    
+    # Key Metrics Row
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        total_sales = summary.count if approximate else kpis.total_sales
+        st.metric("Number Of Sales", total_sales, delta=f"+{np.random.randint(5, 15)}")
+    
+    with col2:
+        total_revenue = summary.revenue if approximate else kpis.total_revenue
+        st.metric("Total Sales", f"Rs.{total_revenue/1000000:.1f}M", delta="+12%")
+    
+    with col3:
+        monthly_profit = total_revenue * 0.15  # Assuming 15% profit margin
+        st.metric("Monthly Profit", f"Rs.{monthly_profit/1000000:.1f}M", delta="+8%")
+    
+    with col4:
+        vehicles_under_repair = kpis.vehicles_under_repair
+        st.metric("Vehicles Under Repair", vehicles_under_repair, delta=f"-{np.random.randint(1, 5)}")
+    
+    if approximate:
+        customers, customers_error = summary.unique_customers()
+        top_model, exact_top = summary.top_model()
+        st.caption(f"Sales rollups from per-day sketches: ≈{customers:,.0f} ± {customers_error:,.0f} unique customers (~95%), "
+                   f"top model {top_model or 'N/A'}{'' if exact_top else ' (not guaranteed)'}.")
+    
+    # Charts Row 1
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown('<div class="chart-container">', unsafe_allow_html=True)
+        st.subheader("Total Sales 2025")
+        st.plotly_chart(load_figure('monthly_sales_figure', monthly_sales_figure, kpis), use_container_width=True)
+        st.markdown('</div>', unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown('<div class="chart-container">', unsafe_allow_html=True)
+        st.subheader("Monthly Sales Vehicle")
+        st.plotly_chart(load_figure('monthly_count_figure', monthly_count_figure, kpis), use_container_width=True)
+        st.markdown('</div>', unsafe_allow_html=True)
+    
+    # Charts Row 2
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.markdown('<div class="chart-container">', unsafe_allow_html=True)
+        st.subheader("Sales Breakdown by Vehicle Type")
+        st.plotly_chart(load_figure('vehicle_type_figure', vehicle_type_figure, kpis), use_container_width=True)
+        st.markdown('</div>', unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown('<div class="chart-container">', unsafe_allow_html=True)
+        st.subheader("Repair Cost Analytics")
+        total_repair_cost = kpis.total_repair_cost
+        avg_repair_time = "23m"  # Sample data
+        
+        st.write(f"**Total Repair Cost:** Rs.{total_repair_cost/1000:.1f}k")
+        st.write(f"**Avg. Repair Time:** {avg_repair_time}")
+        st.write(f"**Days:** 1")
+        st.write(f"**No. of Vehicles Under Repair:** {vehicles_under_repair}")
+        st.markdown('</div>', unsafe_allow_html=True)
+    
+    with col3:
+        st.markdown('<div class="chart-container">', unsafe_allow_html=True)
+        st.subheader("Inventory Status")
+        st.plotly_chart(load_figure('inventory_figure', inventory_figure, kpis), use_container_width=True)
+        st.markdown('</div>', unsafe_allow_html=True)
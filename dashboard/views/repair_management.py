@@ -0,0 +1,47 @@
+"""Repair Management page."""
+
+import streamlit as st
+
+from data import load_dataset
+
+
+def render():
+    dataset = load_dataset()
+    df = dataset.frame
+
+    st.title("Repair Management")
+    
+    tab1, tab2, tab3 = st.tabs(["Active Repairs", "Add Repair", "Repair History"])
+    
+    with tab1:
+        st.subheader("Active Repairs")
+        repair_data = dataset.view().where(Status='Under Repair')
+        st.dataframe(repair_data.frame(['VehicleNumber', 'Model', 'RepairCost', 'RepairStatus']), use_container_width=True)
+    
+    with tab2:
+        st.subheader("Add New Repair")
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            repair_vehicle = st.selectbox("Vehicle Number", df['VehicleNumber'].tolist())
+            repair_start_date = st.date_input("Repair Start Date")
+            repair_details = st.text_area("Repair Details")
+            repair_location = st.text_input("Location")
+        
+        with col2:
+            repair_end_date = st.date_input("Repair End Date")
+            repair_amount = st.number_input("Repair Amount (Rs.)", min_value=0, step=100)
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            if st.button("Clear"):
+                st.rerun()
+        with col2:
+            if st.button("Save", type="primary"):
+                st.success("Repair record saved!")
+    
+    with tab3:
+        st.subheader("Repair History")
+        # Sample repair history
+        repair_history = dataset.view().mask(df['RepairCost'] > 0)
+        st.dataframe(repair_history.frame(['VehicleNumber', 'Model', 'RepairCost', 'RepairStatus']), use_container_width=True)
@@ -0,0 +1,138 @@
+"""Sales Reports page: date-ranged sales metrics and trends."""
+
+from datetime import datetime, timedelta
+import pandas as pd
+import streamlit as st
+import plotly.express as px
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+from approx import approximate_mode_toggle, load_sales_sketches
+from data import load_dataset
+from kpi import SalesReportKPIs
+
+
+def render():
+    dataset = load_dataset()
+    df = dataset.frame
+
+    st.title("Sales Reports & Analytics")
+    
+    # Date range selector
+    col1, col2 = st.columns(2)
+    with col1:
+        start_date = st.date_input("Start Date", value=datetime.now() - timedelta(days=365))
+    with col2:
+        end_date = st.date_input("End Date", value=datetime.now())
+    
+    approximate = approximate_mode_toggle(df, key="sales_reports_approx")
+    
+    # Filter data by date range (row positions into the shared dataset, no copy).
+    # Approximate mode only scans the rows if the detail table is asked for.
+    def select_sold_in_range():
+        return dataset.view().mask((df['PurchaseDate'] >= pd.Timestamp(start_date)) & 
+                                   (df['PurchaseDate'] < pd.Timestamp(end_date) + pd.Timedelta(days=1)) & 
+                                   (df['Status'] == 'Sold'))
+    
+    if approximate:
+        summary = load_sales_sketches().summarize(start_date, end_date)
+        total_sales = summary.count
+        total_revenue = summary.revenue
+        top_model, exact_top = summary.top_model()
+        model_sales = pd.Series({model: estimate for model, estimate, _ in summary.top_models()}, dtype=float)
+        payment_sales = pd.Series(summary.payment_methods, dtype=float).sort_values(ascending=False)
+        monthly_sales = pd.DataFrame(
+            [(month, revenue, count) for month, (revenue, count) in summary.monthly.items()],
+            columns=['PurchaseDate', 'Payment', 'VehicleNumber']
+        )
+        customers, customers_error = summary.unique_customers()
+        unique_customers = f"≈{customers:,.0f} ± {customers_error:,.0f}"
+        median, (median_low, median_high) = summary.payment_quantile(0.5)
+        p90, (p90_low, p90_high) = summary.payment_quantile(0.9)
+        median_sale = f"≈Rs.{median:,.0f}" if median is not None else "N/A"
+        p90_sale = f"≈Rs.{p90:,.0f}" if p90 is not None else "N/A"
+    else:
+        # Every metric and breakdown from one pass over the selected rows
+        sold_in_range = select_sold_in_range()
+        kpis = SalesReportKPIs(df, sold_in_range.rows)
+        total_sales = kpis.total_sales
+        total_revenue = kpis.total_revenue
+        top_model = kpis.top_model
+        model_sales = kpis.model_sales
+        payment_sales = kpis.payment_sales
+        monthly_sales = kpis.monthly
+        unique_customers = f"{kpis.unique_customers:,}"
+        median_sale = f"Rs.{kpis.median_payment:,.0f}" if kpis.median_payment is not None else "N/A"
+        p90_sale = f"Rs.{kpis.p90_payment:,.0f}" if kpis.p90_payment is not None else "N/A"
+    
+    # Key metrics
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Total Sales", total_sales)
+    with col2:
+        st.metric("Total Revenue", f"Rs.{total_revenue/1000000:.2f}M")
+    with col3:
+        st.metric("Average Sale", f"Rs.{total_revenue / total_sales:.0f}" if total_sales else "N/A")
+    with col4:
+        st.metric("Top Model", top_model if top_model is not None else "N/A")
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Unique Customers", unique_customers)
+    with col2:
+        st.metric("Median Sale", median_sale)
+    with col3:
+        st.metric("90th Percentile Sale", p90_sale)
+    
+    if approximate:
+        bounds = [f"unique customers within ±{customers_error:,.0f} (~95%)"]
+        if median is not None:
+            bounds.append(f"median in Rs.{median_low:,.0f}–{median_high:,.0f}, "
+                          f"90th percentile in Rs.{p90_low:,.0f}–{p90_high:,.0f} (~99%)")
+        if top_model is not None and not exact_top:
+            bounds.append(f"top model '{top_model}' is not guaranteed")
+        st.caption("Approximate answers: " + "; ".join(bounds) + ". Counts and revenue are exact.")
+    
+    # Charts
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        # Sales by Model
+        st.subheader("Sales by Model")
+        fig = px.pie(values=model_sales.values, names=model_sales.index, 
+                    title="Sales Distribution by Model")
+        st.plotly_chart(fig, use_container_width=True)
+    
+    with col2:
+        # Sales by Payment Method
+        st.subheader("Sales by Payment Method")
+        fig = px.bar(x=payment_sales.index, y=payment_sales.values,
+                    title="Sales by Payment Method")
+        st.plotly_chart(fig, use_container_width=True)
+    
+    # Monthly sales trend
+    st.subheader("Monthly Sales Trend")
+    
+    fig = make_subplots(specs=[[{"secondary_y": True}]])
+    fig.add_trace(
+        go.Bar(x=monthly_sales['PurchaseDate'], y=monthly_sales['Payment'], 
+               name="Revenue", marker_color='lightblue'),
+        secondary_y=False,
+    )
+    fig.add_trace(
+        go.Scatter(x=monthly_sales['PurchaseDate'], y=monthly_sales['VehicleNumber'], 
+                  name="Count", mode='lines+markers', marker_color='red'),
+        secondary_y=True,
+    )
+    fig.update_yaxes(title_text="Revenue (Rs.)", secondary_y=False)
+    fig.update_yaxes(title_text="Number of Sales", secondary_y=True)
+    fig.update_layout(title_text="Monthly Sales Revenue and Count")
+    
+    st.plotly_chart(fig, use_container_width=True)
+    
+    # Detailed sales table
+    st.subheader("Detailed Sales Data")
+    if not approximate:
+        st.dataframe(sold_in_range.frame(), use_container_width=True)
+    elif st.checkbox("Load the sales rows for this range (scans the full history)", key="sales_reports_rows"):
+        st.dataframe(select_sold_in_range().frame(), use_container_width=True)
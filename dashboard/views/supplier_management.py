@@ -0,0 +1,73 @@
+"""Supplier Management page."""
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+
+# Generate supplier data (once per process, shared by all sessions)
+@st.cache_resource
+def load_suppliers():
+    return pd.DataFrame({
+        'SupplierID': range(1, 11),
+        'FirstName': [f"Supplier_{i}" for i in range(1, 11)],
+        'LastName': [f"LastName_{i}" for i in range(1, 11)],
+        'Address': [f"Supplier Address {i}" for i in range(1, 11)],
+        'NIC': [f"{np.random.randint(100000000, 999999999)}V" for _ in range(10)],
+        'Phone': [f"07{np.random.randint(10000000, 99999999)}" for _ in range(10)]
+    })
+
+
+def render():
+    suppliers = load_suppliers()
+
+    st.title("Supplier Management")
+    
+    tab1, tab2, tab3 = st.tabs(["All Suppliers", "Add Supplier", "Update Supplier"])
+    
+    with tab1:
+        st.dataframe(suppliers, use_container_width=True)
+    
+    with tab2:
+        st.subheader("Add New Supplier")
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            supplier_first_name = st.text_input("First Name")
+            supplier_address = st.text_area("Address")
+            supplier_nic = st.text_input("NIC Number")
+        
+        with col2:
+            supplier_last_name = st.text_input("Last Name")
+            supplier_phone = st.text_input("Phone Numbers")
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            if st.button("Clear"):
+                st.rerun()
+        with col2:
+            if st.button("Submit", type="primary"):
+                st.success("Supplier added successfully!")
+    
+    with tab3:
+        st.subheader("Update Supplier")
+        supplier_to_update = st.selectbox("Select Supplier", suppliers['FirstName'].tolist())
+        
+        if supplier_to_update:
+            col1, col2 = st.columns(2)
+            with col1:
+                st.text_input("First Name", value="Sample", key="update_sup_fname")
+                st.text_area("Address", value="Sample Address", key="update_sup_address")
+                st.text_input("NIC Number", value="123456789V", key="update_sup_nic")
+            
+            with col2:
+                st.text_input("Last Name", value="Supplier", key="update_sup_lname")
+                st.text_input("Phone Number", value="0771234567", key="update_sup_phone")
+            
+            col1, col2 = st.columns(2)
+            with col1:
+                if st.button("Delete Supplier", type="secondary"):
+                    st.warning("Supplier deleted!")
+            with col2:
+                if st.button("Save Changes", type="primary"):
+                    st.success("Supplier updated successfully!")
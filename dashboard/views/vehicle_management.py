@@ -0,0 +1,101 @@
+"""Vehicle Management page: browse, add, update and act on vehicles."""
+
+import streamlit as st
+
+from data import load_dataset
+
+
+def render():
+    dataset = load_dataset()
+    df = dataset.frame
+
+    st.title("Vehicle Management")
+    
+    tab1, tab2, tab3, tab4 = st.tabs(["All Vehicles", "Add Vehicle", "Update Vehicle", "Vehicle Actions"])
+    
+    with tab1:
+        st.subheader("All Vehicles")
+        
+        # Filters
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            vehicle_type_filter = st.selectbox("Filter by Type", ["All"] + list(df['VehicleType'].unique()))
+        with col2:
+            status_filter = st.selectbox("Filter by Status", ["All"] + list(df['Status'].unique()))
+        with col3:
+            model_filter = st.selectbox("Filter by Model", ["All"] + list(df['Model'].unique()))
+        
+        # Apply filters (row positions into the shared dataset, no copy)
+        filtered = dataset.view().where(VehicleType=vehicle_type_filter, Status=status_filter, Model=model_filter)
+        
+        st.dataframe(filtered.frame(), use_container_width=True)
+    
+    with tab2:
+        st.subheader("Add New Vehicle")
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            vehicle_number = st.text_input("Vehicle Number", placeholder="e.g., ABC 1234")
+            vehicle_type = st.selectbox("Vehicle Type", ["Bike", "Three Wheeler"])
+            
+            if vehicle_type == "Bike":
+                model = st.selectbox("Model", ['Dio', 'Pulsar', 'Fz', 'Ct100', 'Platina'])
+            else:
+                model = st.selectbox("Model", ['Auto Rickshaw', 'Three Wheeler'])
+            
+            purchase_price = st.number_input("Purchase Price (Rs.)", min_value=0, step=1000)
+        
+        with col2:
+            customer_id = st.number_input("Customer ID", min_value=1, step=1)
+            employee_id = st.number_input("Employee ID", min_value=1, step=1)
+            payment_method = st.selectbox("Payment Method", ['Cash', 'Credit Card', 'Bank Transfer', 'Cheque'])
+            status = st.selectbox("Status", ['Available', 'Sold', 'Under Repair'])
+        
+        if st.button("Add Vehicle", type="primary"):
+            # Here you would insert into database
+            st.success("Vehicle added successfully!")
+    
+    with tab3:
+        st.subheader("Update Vehicle")
+        
+        vehicle_to_update = st.selectbox("Select Vehicle to Update", df['VehicleNumber'].tolist())
+        
+        if vehicle_to_update:
+            selected_vehicle = df[df['VehicleNumber'] == vehicle_to_update].iloc[0]
+            
+            col1, col2 = st.columns(2)
+            with col1:
+                new_status = st.selectbox("Status", ['Available', 'Sold', 'Under Repair'], 
+                                        index=['Available', 'Sold', 'Under Repair'].index(selected_vehicle['Status']))
+                new_price = st.number_input("Price", value=int(selected_vehicle['Payment']))
+            
+            with col2:
+                new_customer = st.number_input("Customer ID", value=int(selected_vehicle['CustomerId']))
+                new_employee = st.number_input("Employee ID", value=int(selected_vehicle['EmployeeId']))
+            
+            if st.button("Update Vehicle", type="primary"):
+                st.success("Vehicle updated successfully!")
+    
+    with tab4:
+        st.subheader("Vehicle Actions")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.subheader("Repair Vehicle")
+            repair_vehicle = st.selectbox("Select Vehicle for Repair", df['VehicleNumber'].tolist())
+            repair_details = st.text_area("Repair Details")
+            repair_cost = st.number_input("Repair Cost (Rs.)", min_value=0, step=100)
+            
+            if st.button("Submit for Repair"):
+                st.success("Vehicle submitted for repair!")
+        
+        with col2:
+            st.subheader("Sell Vehicle")
+            available_vehicles = dataset.view().where(Status='Available').column('VehicleNumber').tolist()
+            if available_vehicles:
+                sell_vehicle = st.selectbox("Select Vehicle to Sell", available_vehicles)
+                if st.button("Mark as Sold"):
+                    st.success("Vehicle marked as sold!")
+            else:
+                st.info("No vehicles available for sale")